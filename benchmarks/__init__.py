@@ -0,0 +1,2 @@
+from .benchmark import Benchmark
+from .generators import GENERATORS, bridge, howe, lattice, pratt, warren
@@ -0,0 +1,64 @@
+import argparse
+import json
+import sys
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import truss_fea
+
+from .benchmark import Benchmark
+from .generators import GENERATORS
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Time the construction, solve stages and plotting of "
+        "generated trusses and report the results as JSON.",
+    )
+    parser.add_argument(
+        "-g",
+        "--generators",
+        nargs="+",
+        choices=tuple(GENERATORS),
+        default=tuple(GENERATORS),
+    )
+    parser.add_argument(
+        "-s",
+        "--sizes",
+        nargs="+",
+        type=lambda value: int(float(value)),
+        default=(100, 1000, 10000, 100000, 1000000),
+        help="approximate number of members, e.g. 1e2 1e4 1e6",
+    )
+    parser.add_argument("-m", "--method", default="SparseCholesky_method")
+    parser.add_argument("-r", "--repeat", type=int, default=1)
+    parser.add_argument(
+        "--plot-limit",
+        type=int,
+        default=100000,
+        help="skip plotting trusses with more members than this",
+    )
+    parser.add_argument("-o", "--output", help="write to a file instead of stdout")
+    options = parser.parse_args(arguments)
+
+    results = Benchmark(
+        options.generators,
+        options.sizes,
+        getattr(truss_fea, options.method),
+        options.plot_limit,
+        options.repeat,
+    ).execute()
+
+    if options.output is None:
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        with open(options.output, "w") as output:
+            json.dump(results, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
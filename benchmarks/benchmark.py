@@ -0,0 +1,151 @@
+import platform
+import time
+import tracemalloc
+from typing import Callable, Dict, Sequence
+
+import numpy as np
+import scipy
+from truss_fea import (
+    ConvergenceError,
+    Method,
+    Plot,
+    Profiler,
+    SparseCholesky_method,
+    StabilityError,
+    Truss,
+)
+
+from .generators import GENERATORS
+
+
+class Benchmark:
+    generators: Dict[str, Callable[[int], Truss]]
+    sizes: Sequence[int]
+    method: Method
+    plot_limit: int
+    repeat: int
+    tolerance: float
+
+    def __init__(
+        self,
+        generators: Sequence[str] = tuple(GENERATORS),
+        sizes: Sequence[int] = (100, 1000, 10000, 100000, 1000000),
+        method: Method = SparseCholesky_method,
+        plot_limit: int = 100000,
+        repeat: int = 1,
+        tolerance: float = 1e-8,
+    ):
+        self.generators = {name: GENERATORS[name] for name in generators}
+        self.sizes = tuple(sizes)
+        self.method = method
+        self.plot_limit = plot_limit
+        self.repeat = repeat
+        self.tolerance = tolerance
+
+    def execute(self):
+        return {
+            "environment": Benchmark.environment(),
+            "method": getattr(self.method, "__name__", type(self.method).__name__),
+            "runs": [
+                self.run(name, size)
+                for name in self.generators
+                for size in self.sizes
+                for _ in range(self.repeat)
+            ],
+        }
+
+    def run(self, name: str, size: int):
+        times, memory = {}, {}
+        telemetry = {}
+
+        def record(values: dict):
+            stage = values["stage"]
+            times[stage] = values["time"]
+            memory[stage] = values["memory"]
+            telemetry[stage] = {
+                key: value
+                for key, value in values.items()
+                if key not in ("stage", "time", "memory")
+            }
+
+        with Profiler(callbacks=[record]) as profiler:
+            truss = self._measure(
+                "construction", times, memory, self.generators[name], size
+            )
+            truss.set_profiler(profiler)
+
+            try:
+                truss.solve(method=self.method, tolerance=self.tolerance)
+                error = Benchmark._get_error(telemetry, self.tolerance)
+            except (ConvergenceError, StabilityError) as exception:
+                error = str(exception)
+
+            if error is None and len(truss.beams) <= self.plot_limit:
+                self._measure("plot", times, memory, Benchmark._plot, truss)
+
+        run = {
+            "generator": name,
+            "size": size,
+            "nodes": len(truss.nodes),
+            "beams": len(truss.beams),
+            "telemetry": {
+                stage: values for stage, values in telemetry.items() if values
+            },
+        }
+
+        if error is not None:
+            return {**run, "error": error}
+
+        return {
+            **run,
+            "times": times,
+            "memory": memory,
+            "total": sum(times.values()),
+            "peak_memory": max(memory.values()),
+        }
+
+    @staticmethod
+    def _get_error(telemetry: dict, tolerance: float):
+        solve = telemetry.get("displacement", {})
+
+        if solve.get("converged", True):
+            return None
+
+        return (
+            f"Solve residual {solve['residual']:.3g} is above the tolerance "
+            f"{tolerance:.3g}"
+        )
+
+    @staticmethod
+    def environment():
+        return {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+            "numpy": np.__version__,
+            "scipy": scipy.__version__,
+        }
+
+    @staticmethod
+    def _measure(stage: str, times: dict, memory: dict, function: Callable, *args):
+        tracemalloc.reset_peak()
+
+        current = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        result = function(*args)
+        times[stage] = time.perf_counter() - start
+        memory[stage] = tracemalloc.get_traced_memory()[1] - current
+
+        return result
+
+    @staticmethod
+    def _plot(truss: Truss):
+        from matplotlib import pyplot as plt
+
+        fig = plt.figure()
+
+        try:
+            Plot.execute(truss, True, False, None, None, None, None, None)
+            fig.canvas.draw()
+        finally:
+            plt.close(fig)
@@ -0,0 +1,167 @@
+import numpy as np
+from truss_fea import Material, Truss
+
+STEEL = Material(200e9, 1e-3, yield_stress=250e6, inertia=1e-7)
+
+
+def chain(start: int, count: int):
+    index = np.arange(start, start + count)
+
+    return np.column_stack((index[:-1], index[1:]))
+
+
+def girder(
+    panels: int,
+    diagonals: str,
+    length: float = 1.0,
+    height: float = 1.0,
+    span: int = 16,
+):
+    x = np.arange(panels + 1) * length
+    bottom = np.column_stack((x, np.zeros(panels + 1)))
+    top = np.column_stack((x, np.full(panels + 1, height)))
+    coordinates = np.concatenate((bottom, top))
+
+    b = np.arange(panels + 1)
+    t = b + panels + 1
+    left = np.arange(panels)
+    right = left + 1
+    middle = left % span < span // 2
+
+    if diagonals == "pratt":
+        rising = ~middle
+    elif diagonals == "howe":
+        rising = middle
+    else:
+        raise ValueError(f"Unknown diagonals {diagonals!r}")
+
+    connectivity = np.concatenate(
+        (
+            chain(0, panels + 1),
+            chain(panels + 1, panels + 1),
+            np.column_stack((b, t)),
+            np.where(
+                rising[:, None],
+                np.column_stack((b[left], t[right])),
+                np.column_stack((t[left], b[right])),
+            ),
+        )
+    )
+
+    supports = np.zeros(coordinates.shape, dtype=np.bool_)
+    supports[0] = True
+    supports[np.r_[b[span::span], panels], 1] = True
+    loads = np.zeros(coordinates.shape)
+    loads[t, 1] = -1e3
+
+    return Truss.from_arrays(coordinates, connectivity, STEEL, supports, loads)
+
+
+def pratt(members: int):
+    return girder(max(2, members // 4), "pratt")
+
+
+def howe(members: int):
+    return girder(max(2, members // 4), "howe")
+
+
+def warren(members: int, length: float = 1.0, height: float = 1.0, span: int = 16):
+    panels = max(2, (members + 1) // 4)
+    x = np.arange(panels + 1) * length
+    bottom = np.column_stack((x, np.zeros(panels + 1)))
+    top = np.column_stack((x[:-1] + length / 2, np.full(panels, height)))
+    coordinates = np.concatenate((bottom, top))
+
+    b = np.arange(panels + 1)
+    t = np.arange(panels) + panels + 1
+    connectivity = np.concatenate(
+        (
+            chain(0, panels + 1),
+            chain(panels + 1, panels),
+            np.column_stack((b[:-1], t)),
+            np.column_stack((t, b[1:])),
+        )
+    )
+
+    supports = np.zeros(coordinates.shape, dtype=np.bool_)
+    supports[0] = True
+    supports[np.r_[b[span::span], panels], 1] = True
+    loads = np.zeros(coordinates.shape)
+    loads[b[1:-1], 1] = -1e3
+
+    return Truss.from_arrays(coordinates, connectivity, STEEL, supports, loads)
+
+
+def lattice(members: int, aspect: float = 4.0):
+    ny = max(2, int(np.sqrt(members / (4 * aspect))) + 1)
+    nx = max(2, int(members / (4 * (ny - 1))) + 1)
+    i, j = np.meshgrid(np.arange(nx), np.arange(ny), indexing="ij")
+    coordinates = np.column_stack((i.ravel(), j.ravel())).astype(np.float64)
+    index = np.arange(nx * ny).reshape(nx, ny)
+
+    connectivity = np.concatenate(
+        (
+            np.column_stack((index[:-1].ravel(), index[1:].ravel())),
+            np.column_stack((index[:, :-1].ravel(), index[:, 1:].ravel())),
+            np.column_stack((index[:-1, :-1].ravel(), index[1:, 1:].ravel())),
+            np.column_stack((index[:-1, 1:].ravel(), index[1:, :-1].ravel())),
+        )
+    )
+
+    supports = np.zeros(coordinates.shape, dtype=np.bool_)
+    supports[index[0]] = True
+    loads = np.zeros(coordinates.shape)
+    loads[index[-1], 1] = -1e3
+
+    return Truss.from_arrays(coordinates, connectivity, STEEL, supports, loads)
+
+
+def bridge(members: int, step: float = 20.0, span: int = 16):
+    arches = max(1, round(members / (5 * span)))
+    steps = arches * span
+    length = span * step
+    rise = length / np.pi
+    x = np.arange(steps + 1) * step
+    local = x % length
+    pier = np.arange(steps + 1) % span == 0
+    interior = np.flatnonzero(~pier)
+
+    deck = np.column_stack((x, np.zeros(steps + 1)))
+    arc = np.column_stack(
+        (
+            x[interior],
+            4 * rise * local[interior] * (length - local[interior]) / length**2,
+        )
+    )
+    coordinates = np.concatenate((deck, arc))
+
+    d = np.arange(steps + 1)
+    a = d.copy()
+    a[interior] = np.arange(interior.shape[0]) + steps + 1
+    braced = ~pier[:-1] & ~pier[1:]
+
+    connectivity = np.concatenate(
+        (
+            chain(0, steps + 1),
+            np.column_stack((a[:-1], a[1:])),
+            np.column_stack((a[interior], d[interior])),
+            np.column_stack((a[1:][braced], d[:-1][braced])),
+            np.column_stack((d[1:][braced], a[:-1][braced])),
+        )
+    )
+
+    supports = np.zeros(coordinates.shape, dtype=np.bool_)
+    supports[d[pier]] = True
+    loads = np.zeros(coordinates.shape)
+    loads[d[interior], 1] = -1e3 / interior.shape[0]
+
+    return Truss.from_arrays(coordinates, connectivity, STEEL, supports, loads)
+
+
+GENERATORS = {
+    "warren": warren,
+    "pratt": pratt,
+    "howe": howe,
+    "lattice": lattice,
+    "bridge": bridge,
+}
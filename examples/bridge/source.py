@@ -1,11 +1,8 @@
-from copy import deepcopy
 from typing import List
 
 import numpy as np
 from matplotlib import patches
 from matplotlib import pyplot as plt
-from matplotlib.animation import FuncAnimation
-from matplotlib.colors import TwoSlopeNorm
 from truss_fea import Beam, Material, Node, Truss
 
 
@@ -143,51 +140,24 @@ def make_bridge():
     return bridge
 
 
-def plot(bridge, norm):
-    ax = plt.axes()
-
+def decorate(ax):
     ax.add_patch(patches.Rectangle((-70, -70), 70, 70, color="#BBB"))
     ax.add_patch(patches.Rectangle((400, -70), 70, 70, color="#BBB"))
-
-    plt.title("Bridge example")
-    plt.xlabel("Length [mm]")
-    plt.ylabel("Height [mm]")
-    plt.axis("equal")
-    plt.tight_layout()
-
-    bridge.plot(color="#BBB", show_labels=False, show_nodes=False)
-    bridge.plot_force(norm=norm, scale_label="Internal force [N]", show_labels=False)
+    ax.set_title("Bridge example")
+    ax.set_xlabel("Length [mm]")
+    ax.set_ylabel("Height [mm]")
 
 
 if __name__ == "__main__":
     bridge = make_bridge()
     fig = plt.figure(figsize=(14, 5))
 
-    frames = []
-    scale_max = 0.0
-    scale_min = 0.0
-
-    for i in range(30):
-        bridge.solve(charge=(i + 1) / 30)
-        frames.append(deepcopy(bridge))
-
-        scale_min = min(scale_min, bridge.internal_forces.min())
-        scale_max = max(scale_max, bridge.internal_forces.max())
-
-    norm = TwoSlopeNorm(
-        vmin=scale_min,
-        vcenter=0.0,
-        vmax=scale_max,
+    charges = np.arange(1, 31) / 30
+    animation = bridge.animate(
+        charges=np.concatenate((charges, charges[::-1])),
+        scale_label="Internal force [N]",
+        decorate=decorate,
     )
 
-    def animate(i):
-        fig.clear()
-
-        if i < 30:
-            plot(frames[i], norm)
-        else:
-            plot(frames[29 - i], norm)
-
-    ani = FuncAnimation(fig, animate, frames=60)
-
-    ani.save("examples/bridge/output.gif", fps=30)
+    plt.tight_layout()
+    animation.execute(fig).save("examples/bridge/output.gif", fps=30)
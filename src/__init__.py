@@ -1,8 +1,43 @@
+from .animation import Animation
+from .assembly import Assembly
 from .beam import Beam
+from .cases import Cases
+from .file import File
 from .force import Force
 from .material import Material
-from .method import GaussSeidel_method
+from .method import (
+    BandedCholesky_method,
+    Cholesky_method,
+    ConjugateGradient_method,
+    ConvergenceError,
+    Direct_method,
+    GaussSeidel_method,
+    Iterative_method,
+    LU_method,
+    Method,
+    SparseCholesky_method,
+    SparseLU_method,
+)
 from .node import Node
+from .ordering import (
+    Natural_ordering,
+    NestedDissection_ordering,
+    Ordering,
+    ReverseCuthillMcKee_ordering,
+)
+from .parallel import Parallel
 from .plot import Plot
+from .preconditioner import (
+    IncompleteCholesky_preconditioner,
+    Identity_preconditioner,
+    Jacobi_preconditioner,
+    Preconditioner,
+    SSOR_preconditioner,
+)
+from .profiler import Profiler
+from .results import Results
+from .solution import Solution
 from .solve import Solve
+from .stability import Stability, StabilityError
+from .sweep import Sweep
 from .truss import Truss
@@ -0,0 +1,177 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Callable, Type
+
+import numpy as np
+
+from .cases import Cases
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.colors import Colormap, TwoSlopeNorm
+    from matplotlib.figure import Figure
+
+
+class Animation:
+    coordinates: np.ndarray
+    connectivity: np.ndarray
+    displaced: np.ndarray
+    values: np.ndarray
+    cmap: Type["Colormap"]
+    norm: Type["TwoSlopeNorm"]
+    scale_label: str
+    color: str
+    decorate: Callable[["Axes"], None]
+
+    def __init__(
+        self,
+        coordinates: np.ndarray,
+        connectivity: np.ndarray,
+        cases: Cases,
+        values: str = "internal_forces",
+        cmap: Type["Colormap"] = None,
+        norm: Type["TwoSlopeNorm"] = None,
+        scale_label: str = None,
+        color: str = "#BBB",
+        decorate: Callable[["Axes"], None] = None,
+    ):
+        from matplotlib import colormaps
+        from matplotlib.colors import TwoSlopeNorm
+
+        self.coordinates = coordinates
+        self.connectivity = connectivity
+        self.displaced = coordinates + cases.displacements.reshape(len(cases), -1, 2)
+        self.values = getattr(cases, values) if isinstance(values, str) else values
+        self.cmap = cmap or colormaps["rainbow"]
+        self.norm = norm or TwoSlopeNorm(
+            vmin=min(self.values.min(), -np.finfo(float).eps),
+            vcenter=0.0,
+            vmax=max(self.values.max(), np.finfo(float).eps),
+        )
+        self.scale_label = scale_label
+        self.color = color
+        self.decorate = decorate
+        self._beams = None
+
+    def __len__(self):
+        return self.displaced.shape[0]
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["_beams"] = None
+
+        return state
+
+    def setup(self, ax: "Axes"):
+        from matplotlib.cm import ScalarMappable
+        from matplotlib.collections import LineCollection
+
+        if self.color is not None:
+            ax.add_collection(
+                LineCollection(self.coordinates[self.connectivity], colors=self.color)
+            )
+
+        self._beams = LineCollection(
+            self.displaced[0][self.connectivity], colors=self._get_colors(0)
+        )
+        ax.add_collection(self._beams)
+
+        points = np.concatenate((self.coordinates[None], self.displaced)).reshape(-1, 2)
+        lower, upper = points.min(axis=0), points.max(axis=0)
+        margin = 0.05 * (upper - lower).max()
+
+        ax.set_xlim(lower[0] - margin, upper[0] + margin)
+        ax.set_ylim(lower[1] - margin, upper[1] + margin)
+        ax.set_aspect("equal")
+        ax.figure.colorbar(
+            ScalarMappable(cmap=self.cmap, norm=self.norm),
+            ax=ax,
+            label=self.scale_label,
+        )
+
+        if self.decorate is not None:
+            self.decorate(ax)
+
+        return (self._beams,)
+
+    def update(self, frame: int):
+        self._beams.set_segments(self.displaced[frame][self.connectivity])
+        self._beams.set_color(self._get_colors(frame))
+
+        return (self._beams,)
+
+    def execute(self, fig: "Figure" = None, interval: int = 33, **kwargs):
+        from matplotlib import pyplot as plt
+        from matplotlib.animation import FuncAnimation
+
+        fig = fig or plt.gcf()
+        artists = self.setup(fig.gca())
+
+        return FuncAnimation(
+            fig,
+            self.update,
+            frames=len(self),
+            init_func=lambda: artists,
+            interval=interval,
+            blit=True,
+            **kwargs,
+        )
+
+    def save_frames(
+        self,
+        directory: str,
+        processes: int = None,
+        figsize: tuple = (14, 5),
+        dpi: int = 100,
+    ):
+        os.makedirs(directory, exist_ok=True)
+
+        processes = processes or os.cpu_count() or 1
+        arguments = [
+            (frames, directory, figsize, dpi)
+            for frames in np.array_split(np.arange(len(self)), processes)
+        ]
+
+        if processes == 1:
+            paths = [self._render(*argument) for argument in arguments]
+        else:
+            with ProcessPoolExecutor(processes) as executor:
+                futures = [
+                    executor.submit(self._render, *argument) for argument in arguments
+                ]
+                paths = [future.result() for future in futures]
+
+        return [path for part in paths for path in part]
+
+    def _render(self, frames: np.ndarray, directory: str, figsize: tuple, dpi: int):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        from matplotlib.image import imsave
+
+        fig = Figure(figsize=figsize, dpi=dpi)
+        canvas = FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
+        (beams,) = self.setup(ax)
+        paths = []
+
+        beams.set_animated(True)
+        canvas.draw()
+        background = canvas.copy_from_bbox(fig.bbox)
+
+        for frame in frames:
+            path = os.path.join(directory, f"frame_{frame:05d}.png")
+
+            canvas.restore_region(background)
+            self.update(frame)
+            ax.draw_artist(beams)
+            imsave(
+                path,
+                np.asarray(canvas.buffer_rgba())[..., :3],
+                pil_kwargs={"compress_level": 1},
+            )
+            paths.append(path)
+
+        return paths
+
+    def _get_colors(self, frame: int):
+        return self.cmap(self.norm(self.values[frame]))
@@ -0,0 +1,120 @@
+import numpy as np
+from scipy.sparse import coo_matrix
+
+from .parallel import Parallel
+
+
+class Assembly:
+    @staticmethod
+    def execute(
+        coordinates: np.ndarray,
+        connectivity: np.ndarray,
+        elasticity: np.ndarray,
+        area: np.ndarray,
+        sparse: bool = True,
+        threads: int = 1,
+    ):
+        size = coordinates.shape[0] * 2
+        Ke = np.empty((connectivity.shape[0], 4, 4))
+
+        def rigidity(part: slice):
+            Ke[part] = Assembly.rigidity(
+                coordinates, connectivity[part], elasticity[part], area[part]
+            )
+
+        Parallel.map(rigidity, connectivity.shape[0], threads)
+        rows, cols = Assembly.indices(connectivity)
+
+        if sparse:
+            return coo_matrix(
+                (Ke.ravel(), (rows.ravel(), cols.ravel())), shape=(size, size)
+            ).tocsr()
+
+        K = np.bincount(
+            (rows * size + cols).ravel(), weights=Ke.ravel(), minlength=size * size
+        )
+
+        return K.reshape(size, size)
+
+    @staticmethod
+    def geometry(coordinates: np.ndarray, connectivity: np.ndarray):
+        delta = (
+            coordinates[..., connectivity[:, 1], :]
+            - coordinates[..., connectivity[:, 0], :]
+        )
+        length = np.hypot(delta[..., 0], delta[..., 1])
+
+        return delta[..., 1] / length, delta[..., 0] / length, length
+
+    @staticmethod
+    def distributed(
+        coordinates: np.ndarray, connectivity: np.ndarray, load: np.ndarray
+    ):
+        length = Assembly.geometry(coordinates, connectivity)[2]
+
+        return 0.5 * load * length[:, None]
+
+    @staticmethod
+    def direction(coordinates: np.ndarray, connectivity: np.ndarray):
+        sin, cos, length = Assembly.geometry(coordinates, connectivity)
+
+        return np.stack((-cos, -sin, cos, sin), axis=-1), length
+
+    @staticmethod
+    def rigidity(
+        coordinates: np.ndarray,
+        connectivity: np.ndarray,
+        elasticity: np.ndarray,
+        area: np.ndarray,
+    ):
+        vec, length = Assembly.direction(coordinates, connectivity)
+        longitudinal_rigidity = elasticity * area / length
+
+        return longitudinal_rigidity[:, None, None] * vec[:, :, None] * vec[:, None, :]
+
+    @staticmethod
+    def deformation(
+        coordinates: np.ndarray, connectivity: np.ndarray, displacement: np.ndarray
+    ):
+        vec, length = Assembly.direction(coordinates, connectivity)
+        u = displacement[..., Assembly.dofs(connectivity)]
+
+        return (vec * u).sum(axis=-1) / length
+
+    @staticmethod
+    def internal(
+        coordinates: np.ndarray,
+        displaced: np.ndarray,
+        connectivity: np.ndarray,
+        displacement: np.ndarray,
+        elasticity: np.ndarray,
+        area: np.ndarray,
+        yield_stress: np.ndarray,
+        inertia: np.ndarray,
+    ):
+        length = Assembly.geometry(coordinates, connectivity)[2]
+        deformation = Assembly.deformation(displaced, connectivity, displacement)
+        tension = deformation * elasticity
+        forces = tension * area
+        energy = 0.5 * forces * deformation * length
+        critical = np.pi**2 * elasticity * inertia / length**2
+
+        utilization = np.abs(tension) / yield_stress
+        buckling = np.maximum(-forces, 0.0) / critical
+
+        return deformation, tension, forces, energy, utilization, buckling
+
+    @staticmethod
+    def dofs(connectivity: np.ndarray):
+        i1 = connectivity[:, 0] * 2
+        i2 = connectivity[:, 1] * 2
+
+        return np.column_stack((i1, i1 + 1, i2, i2 + 1))
+
+    @staticmethod
+    def indices(connectivity: np.ndarray):
+        dofs = Assembly.dofs(connectivity)
+        rows = np.broadcast_to(dofs[:, :, None], (dofs.shape[0], 4, 4))
+        cols = np.broadcast_to(dofs[:, None, :], (dofs.shape[0], 4, 4))
+
+        return rows, cols
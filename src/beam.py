@@ -2,19 +2,63 @@ import numpy as np
 
 from .material import Material
 from .node import Node
+from .store import Store
 
 
 class Beam:
-    id: int = None
-    node1: Node
-    node2: Node
-    material: Material
-    color: str
+    __slots__ = ("_store", "_index", "_node1", "_node2")
 
     def __init__(self, node1: Node, node2: Node, color: str = "#BBB"):
-        self.node1 = node1
-        self.node2 = node2
-        self.color = color
+        self._node1 = node1
+        self._node2 = node2
+        self._store = Store.detached(
+            beams={"connectivity": (node1.id, node2.id), "color": color}
+        )
+        self._index = 0
+
+    @classmethod
+    def _view(cls, store: Store, index: int, node1: Node = None, node2: Node = None):
+        id1, id2 = store.beams["connectivity"][index]
+
+        beam = cls.__new__(cls)
+        beam._store = store
+        beam._index = index
+        beam._node1 = node1 or store.nodes.views[id1]
+        beam._node2 = node2 or store.nodes.views[id2]
+
+        return beam
+
+    @property
+    def id(self) -> int:
+        return self._index
+
+    @property
+    def node1(self) -> Node:
+        return self._node1
+
+    @node1.setter
+    def node1(self, node: Node):
+        self._node1 = node
+        self._store.beams["connectivity"][self._index, 0] = node.id
+        self._store.beams["cached"][self._index] = -1
+
+    @property
+    def node2(self) -> Node:
+        return self._node2
+
+    @node2.setter
+    def node2(self, node: Node):
+        self._node2 = node
+        self._store.beams["connectivity"][self._index, 1] = node.id
+        self._store.beams["cached"][self._index] = -1
+
+    @property
+    def material(self) -> Material:
+        return self._store.get_material(self._store.beams["material"][self._index])
+
+    @property
+    def color(self) -> str:
+        return self._store.beams.value("color", self._index)
 
     @property
     def center(self):
@@ -25,48 +69,58 @@ class Beam:
 
     @property
     def length(self):
-        return self.node1.get_distance_from(self.node2)
+        return self._geometry[2]
 
     @property
     def angle(self):
-        return self.node1.get_angle_from(self.node2)
+        return self._geometry[3]
 
     @property
     def sin_cos(self):
-        dx = self.node2.x - self.node1.x
-        dy = self.node2.y - self.node1.y
-        l = np.sqrt(dx**2 + dy**2)
+        sin, cos = self._geometry[:2]
 
-        return dy / l, dx / l
+        return sin, cos
 
     @property
     def rigidity(self):
-        longitudinal_rigidity = (
-            self.material.elasticity * self.material.area / self.length
-        )
-        sin, cos = self.sin_cos
-        axis = np.array(
-            [
-                [cos, sin, 0.0, 0.0],
-                [0.0, 0.0, cos, sin],
-            ]
-        )
-        signal = np.array(
-            [
-                [1.0, -1.0],
-                [-1.0, 1.0],
-            ]
-        )
+        sin, cos, _, _, longitudinal_rigidity = self._geometry
+        vec = np.array([-cos, -sin, cos, sin])
+
+        return longitudinal_rigidity * np.outer(vec, vec)
 
-        return np.matmul(np.matmul(axis.T * longitudinal_rigidity, signal), axis)
+    @property
+    def _geometry(self) -> np.ndarray:
+        store, index = self._store, self._index
+
+        if self._node1._store is not store or self._node2._store is not store:
+            elasticity, area = store.properties[store.beams["material"][index], :2]
+
+            return Store.get_geometry(
+                np.array(
+                    [(self._node1.x, self._node1.y), (self._node2.x, self._node2.y)]
+                ),
+                np.array([(0, 1)]),
+                elasticity,
+                area,
+            )[0]
+
+        material = store.beams["material"][index]
+        key = store.get_geometry_key(self._node1, self._node2, material)
+
+        if tuple(store.beams["cached"][index]) != key:
+            store.update_geometry()
+
+        return store.beams["geometry"][index]
 
     def set_material(self, material: Material):
-        self.material = material
+        self._store.beams["material"][self._index] = self._store.register_material(
+            material
+        )
 
         return self
 
     def set_color(self, color: str):
-        self.color = color
+        self._store.beams["color"][self._index] = color
 
         return self
 
@@ -0,0 +1,42 @@
+import numpy as np
+
+
+class Cases:
+    displacements: np.ndarray
+    forces: np.ndarray
+    mask: np.ndarray
+    internal_deformation: np.ndarray
+    internal_tension: np.ndarray
+    internal_forces: np.ndarray
+    internal_energy: np.ndarray
+    utilization: np.ndarray
+    buckling: np.ndarray
+
+    def __init__(
+        self,
+        displacements: np.ndarray,
+        forces: np.ndarray,
+        mask: np.ndarray,
+        internal_deformation: np.ndarray,
+        internal_tension: np.ndarray,
+        internal_forces: np.ndarray,
+        internal_energy: np.ndarray,
+        utilization: np.ndarray,
+        buckling: np.ndarray,
+    ):
+        self.displacements = displacements
+        self.forces = forces
+        self.mask = mask
+        self.internal_deformation = internal_deformation
+        self.internal_tension = internal_tension
+        self.internal_forces = internal_forces
+        self.internal_energy = internal_energy
+        self.utilization = utilization
+        self.buckling = buckling
+
+    def __len__(self):
+        return self.displacements.shape[0]
+
+    @property
+    def reactions(self):
+        return np.where(self.mask, self.forces, 0.0)
@@ -1,10 +1,28 @@
 class Displacement:
-    x: bool
-    y: bool
+    __slots__ = ("_node",)
 
-    def __init__(self):
-        self.x = False
-        self.y = False
+    def __init__(self, node):
+        self._node = node
+
+    @property
+    def _supports(self):
+        return self._node._store.nodes["supports"][self._node._index]
+
+    @property
+    def x(self) -> bool:
+        return bool(self._supports[0])
+
+    @x.setter
+    def x(self, x: bool):
+        self._supports[0] = x
+
+    @property
+    def y(self) -> bool:
+        return bool(self._supports[1])
+
+    @y.setter
+    def y(self, y: bool):
+        self._supports[1] = y
 
     @property
     def vec(self):
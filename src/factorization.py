@@ -0,0 +1,43 @@
+from typing import Callable
+
+import numpy as np
+from scipy.linalg import lu_factor, lu_solve
+from scipy.sparse import csc_matrix, hstack
+
+
+class Factorization:
+    solve: Callable[[np.ndarray], np.ndarray]
+    V: csc_matrix
+    d: np.ndarray
+
+    def __init__(self, solve: Callable[[np.ndarray], np.ndarray], size: int):
+        self.solve = solve
+        self.V = csc_matrix((size, 0))
+        self.d = np.zeros(0)
+        self._W = np.zeros((size, 0))
+        self._C = None
+
+    def __call__(self, y: np.ndarray):
+        x = self.solve(y)
+
+        if self.rank > 0:
+            x = x - self._W @ lu_solve(self._C, self.V.T @ x)
+
+        return x
+
+    @property
+    def rank(self):
+        return self.d.shape[0]
+
+    def update(self, V: csc_matrix, d: np.ndarray):
+        if d.shape[0] == 0:
+            return self
+
+        W = self.solve(V.toarray()).reshape(V.shape)
+
+        self.V = hstack((self.V, V), format="csc")
+        self.d = np.concatenate((self.d, d))
+        self._W = np.hstack((self._W, W))
+        self._C = lu_factor(np.diag(1.0 / self.d) + (self.V.T @ self._W))
+
+        return self
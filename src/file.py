@@ -0,0 +1,169 @@
+import os
+from itertools import islice
+from typing import Dict
+
+import numpy as np
+
+from .truss import Truss
+
+
+class File:
+    COLUMNS = ("coordinates", "supports", "loads", "connectivity", "material")
+    OPTIONAL = ("load_beams", "beam_loads", "gravity")
+
+    @staticmethod
+    def save(truss: Truss, path: str):
+        arrays = File.get_arrays(truss)
+
+        if str(path).endswith(".npz"):
+            np.savez(path, **arrays)
+
+            return path
+
+        os.makedirs(path, exist_ok=True)
+
+        for name, array in arrays.items():
+            np.save(os.path.join(path, f"{name}.npy"), array)
+
+        return path
+
+    @staticmethod
+    def load(path: str, mmap: bool = False):
+        if os.path.isdir(path):
+            arrays = {
+                name: np.load(
+                    os.path.join(path, f"{name}.npy"), mmap_mode="c" if mmap else None
+                )
+                for name in (*File.COLUMNS, "materials", *File.OPTIONAL)
+                if name in File.COLUMNS
+                or os.path.exists(os.path.join(path, f"{name}.npy"))
+            }
+        else:
+            with np.load(path) as archive:
+                arrays = {name: archive[name] for name in archive.files}
+
+        return File.make_truss(**arrays)
+
+    @staticmethod
+    def read_text(path: str, chunk_size: int = 1 << 16):
+        nodes, beams = [], []
+        materials: Dict[tuple, int] = {}
+
+        with open(path, "r") as entry:
+            sections = iter((nodes, beams))
+            section = next(sections)
+
+            while section is not None:
+                lines = list(islice(entry, chunk_size))
+
+                if len(lines) == 0:
+                    break
+
+                start = 0
+
+                for i, line in enumerate(lines):
+                    if line.strip() == "":
+                        File._read_chunk(lines[start:i], section, materials)
+                        section = next(sections, None)
+                        start = i + 1
+
+                        if section is None:
+                            break
+                else:
+                    File._read_chunk(lines[start:], section, materials)
+
+        nodes = np.concatenate(nodes or [np.zeros((0, 6))])
+        beams = np.concatenate(beams or [np.zeros((0, 3))])
+        materials = np.array(list(materials), dtype=np.float64).reshape(-1, 2)
+
+        return File.make_truss(
+            coordinates=nodes[:, :2],
+            supports=nodes[:, 2:4] == 0.0,
+            loads=nodes[:, 4:],
+            connectivity=beams[:, :2].astype(np.intp) - 1,
+            material=beams[:, 2].astype(np.intp),
+            materials=materials[:, ::-1],
+        )
+
+    @staticmethod
+    def _read_chunk(lines: list, section: list, materials: Dict[tuple, int]):
+        lines = [line.replace("_", "") for line in lines if line.strip() != ""]
+
+        if len(lines) == 0:
+            return
+
+        values = np.loadtxt(lines, dtype=np.float64, ndmin=2)
+
+        if values.shape[1] == 4:
+            unique, inverse = np.unique(values[:, 2:], axis=0, return_inverse=True)
+            index = np.array(
+                [materials.setdefault(tuple(row), len(materials)) for row in unique],
+                dtype=np.float64,
+            )
+            values = np.column_stack((values[:, :2], index[inverse.reshape(-1)]))
+
+        section.append(values)
+
+    @staticmethod
+    def get_arrays(truss: Truss):
+        store = truss.store
+        arrays = {name: store.nodes[name] for name in File.COLUMNS[:3]}
+        arrays.update((name, store.beams[name]) for name in File.COLUMNS[3:])
+        arrays["materials"] = store.properties[:-1]
+
+        if len(store.loads) > 0:
+            arrays["load_beams"] = store.loads["beam"]
+            arrays["beam_loads"] = store.loads["load"]
+
+        if store.gravity is not None:
+            arrays["gravity"] = store.gravity
+
+        return arrays
+
+    @staticmethod
+    def make_truss(
+        coordinates: np.ndarray,
+        supports: np.ndarray,
+        loads: np.ndarray,
+        connectivity: np.ndarray,
+        material: np.ndarray,
+        materials: np.ndarray,
+        load_beams: np.ndarray = None,
+        beam_loads: np.ndarray = None,
+        gravity: np.ndarray = None,
+    ):
+        truss = Truss()
+        store = truss.store
+        index = np.array(
+            [
+                store.register_material(
+                    truss.make_material(
+                        *(None if np.isnan(value) else float(value) for value in row)
+                    )
+                )
+                for row in np.asarray(materials, dtype=np.float64)
+            ]
+            + [-1],
+            dtype=np.intp,
+        )
+
+        if not np.array_equal(index[:-1], np.arange(index.shape[0] - 1)):
+            material = index[material]
+
+        store.nodes.attach(
+            coordinates.shape[0],
+            coordinates=coordinates,
+            supports=supports,
+            loads=loads,
+        )
+        store.beams.attach(
+            connectivity.shape[0], connectivity=connectivity, material=material
+        )
+
+        if load_beams is not None:
+            store.loads.extend(load_beams.shape[0], beam=load_beams, load=beam_loads)
+
+        if gravity is not None:
+            truss.set_gravity(gravity)
+
+        return truss
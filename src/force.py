@@ -2,6 +2,8 @@ import numpy as np
 
 
 class Force:
+    __slots__ = ("x", "y")
+
     x: float
     y: float
 
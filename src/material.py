@@ -1,13 +1,96 @@
 class Material:
-    elasticity: float
-    area: float
+    __slots__ = (
+        "_elasticity",
+        "_area",
+        "_yield_stress",
+        "_inertia",
+        "_density",
+        "_version",
+    )
 
-    def __init__(self, youngs_modulus: float, area: float):
-        self.elasticity = youngs_modulus
-        self.area = area
+    PROPERTIES = ("elasticity", "area", "yield_stress", "inertia", "density")
+
+    def __init__(
+        self,
+        youngs_modulus: float,
+        area: float,
+        yield_stress: float = None,
+        inertia: float = None,
+        density: float = None,
+    ):
+        self._elasticity = youngs_modulus
+        self._area = area
+        self._yield_stress = yield_stress
+        self._inertia = inertia
+        self._density = density
+        self._version = 0
+
+    @property
+    def elasticity(self) -> float:
+        return self._elasticity
+
+    @elasticity.setter
+    def elasticity(self, youngs_modulus: float):
+        self._elasticity = youngs_modulus
+        self._version += 1
+
+    @property
+    def area(self) -> float:
+        return self._area
+
+    @area.setter
+    def area(self, area: float):
+        self._area = area
+        self._version += 1
+
+    @property
+    def yield_stress(self) -> float:
+        return self._yield_stress
+
+    @yield_stress.setter
+    def yield_stress(self, yield_stress: float):
+        self._yield_stress = yield_stress
+        self._version += 1
+
+    @property
+    def inertia(self) -> float:
+        return self._inertia
+
+    @inertia.setter
+    def inertia(self, inertia: float):
+        self._inertia = inertia
+        self._version += 1
+
+    @property
+    def density(self) -> float:
+        return self._density
+
+    @density.setter
+    def density(self, density: float):
+        self._density = density
+        self._version += 1
+
+    @property
+    def values(self):
+        return (
+            self._elasticity,
+            self._area,
+            self._yield_stress,
+            self._inertia,
+            self._density,
+        )
 
     def set_elasticity(self, youngs_modulus: float):
         self.elasticity = youngs_modulus
 
     def set_area(self, area: float):
         self.area = area
+
+    def set_yield_stress(self, yield_stress: float):
+        self.yield_stress = yield_stress
+
+    def set_inertia(self, inertia: float):
+        self.inertia = inertia
+
+    def set_density(self, density: float):
+        self.density = density
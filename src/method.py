@@ -1,39 +1,328 @@
+from typing import List
+
 import numpy as np
+from scipy.linalg import (
+    cho_factor,
+    cho_solve,
+    cho_solve_banded,
+    cholesky_banded,
+    lu_factor,
+    lu_solve,
+)
+from scipy.sparse import csc_matrix, csr_matrix, issparse, triu
+from scipy.sparse.linalg import splu
+
+from .preconditioner import Jacobi_preconditioner, Preconditioner
 
 
 class Method:
-    pass
+    reorders: bool = False
 
+    def solve_batch(
+        self,
+        k: np.ndarray,
+        y: np.ndarray,
+        tolerance: float = 1e-10,
+        blocks: np.ndarray = None,
+    ):
+        return np.column_stack(
+            [self.solve(k, y[:, i], tolerance, blocks) for i in range(y.shape[1])]
+        ).reshape(y.shape)
 
-class GaussSeidel_method(Method):
-    @staticmethod
-    def solve(k: np.ndarray, y: np.ndarray, tolerance: float = 1e-10):
-        x = np.zeros_like(y, dtype=np.float64)
-        conv = [False] * y.shape[0]
 
-        i = -1
-        try:
-            while not all(conv):
-                i = (i + 1) % x.shape[0]
+class ConvergenceError(RuntimeError):
+    method: Method
+    iterations: int
+    residual: float
+
+    def __init__(self, method: Method, tolerance: float):
+        self.method = method
+        self.iterations = method.iterations
+        self.residual = method.residuals[-1] if method.residuals else np.nan
+
+        super().__init__(
+            f"{type(method).__name__} stopped after {self.iterations} iterations "
+            f"with a relative residual of {self.residual:.3g}, above the "
+            f"tolerance of {tolerance:.3g}"
+        )
+
+
+class Iterative_method(Method):
+    x0: np.ndarray
+    warm_start: bool
+    max_iterations: int
+    x: np.ndarray
+    iterations: int
+    residuals: List[float]
+    converged: bool
+
+    def __init__(
+        self,
+        x0: np.ndarray = None,
+        warm_start: bool = False,
+        max_iterations: int = None,
+    ):
+        self.x0 = x0
+        self.warm_start = warm_start
+        self.max_iterations = max_iterations
+        self.x = None
+        self.iterations = 0
+        self.residuals = []
+        self.converged = False
+
+    def solve(
+        self,
+        k: np.ndarray,
+        y: np.ndarray,
+        tolerance: float = 1e-10,
+        blocks: np.ndarray = None,
+    ):
+        return self.solve_from(self._initial_guess(y), k, y, tolerance, blocks)
 
-                if conv[i]:
-                    continue
+    def solve_from(
+        self,
+        x: np.ndarray,
+        k: np.ndarray,
+        y: np.ndarray,
+        tolerance: float = 1e-10,
+        blocks: np.ndarray = None,
+    ):
+        raise NotImplementedError
 
-                xi = GaussSeidel_method._xi(k, x, y, i)
+    def solve_batch(
+        self,
+        k: np.ndarray,
+        y: np.ndarray,
+        tolerance: float = 1e-10,
+        blocks: np.ndarray = None,
+    ):
+        x = np.empty_like(y, dtype=np.float64)
+        converged = True
 
-                if GaussSeidel_method._get_err(x[i], xi) < tolerance:
-                    conv[i] = True
+        for i in range(y.shape[1]):
+            x[:, i] = self.solve(k, y[:, i], tolerance, blocks)
+            converged &= self.converged
 
-                x[i] = xi
-        except KeyboardInterrupt:
-            pass
+        self.converged = converged
 
         return x
 
+    def _initial_guess(self, y: np.ndarray):
+        if self.x0 is not None:
+            return np.array(self.x0, dtype=np.float64)
+
+        if self.warm_start and self.x is not None and self.x.shape == y.shape:
+            return self.x.copy()
+
+        return np.zeros_like(y, dtype=np.float64)
+
+
+class GaussSeidel_method(Iterative_method):
+    omega: float
+    block: bool
+
+    def __init__(
+        self,
+        omega: float = 1.0,
+        block: bool = True,
+        x0: np.ndarray = None,
+        warm_start: bool = False,
+        max_iterations: int = None,
+    ):
+        super().__init__(x0, warm_start, max_iterations)
+
+        self.omega = omega
+        self.block = block
+
+    def solve_from(
+        self,
+        x: np.ndarray,
+        k: np.ndarray,
+        y: np.ndarray,
+        tolerance: float = 1e-10,
+        blocks: np.ndarray = None,
+    ):
+        k = csr_matrix(k)
+        sweep = self._get_sweep(k, blocks if self.block else None)
+        x = np.array(x, dtype=np.float64)
+        max_iterations = self.max_iterations or 100 * y.shape[0]
+        norm = np.linalg.norm(y) or 1.0
+
+        r = y - k @ x
+        self.residuals = [np.linalg.norm(r) / norm]
+        self.iterations = 0
+
+        while self.residuals[-1] > tolerance and self.iterations < max_iterations:
+            x += sweep(r)
+            r = y - k @ x
+
+            self.iterations += 1
+            self.residuals.append(np.linalg.norm(r) / norm)
+
+        self.converged = self.residuals[-1] <= tolerance
+        self.x = x
+
+        return x
+
+    def _get_sweep(self, k: csr_matrix, blocks: np.ndarray):
+        if blocks is None:
+            blocks = np.arange(k.shape[0])
+
+        coo = k.tocoo()
+        lower = blocks[coo.col] <= blocks[coo.row]
+        diagonal = blocks[coo.col] == blocks[coo.row]
+        data = np.where(diagonal, coo.data / self.omega, coo.data)[lower]
+        M = csc_matrix((data, (coo.row[lower], coo.col[lower])), shape=k.shape)
+        factor = splu(
+            M,
+            permc_spec="NATURAL",
+            diag_pivot_thresh=0.0,
+            options={"SymmetricMode": True},
+        )
+
+        return factor.solve
+
+
+class Direct_method(Method):
+    @classmethod
+    def solve(
+        cls,
+        k: np.ndarray,
+        y: np.ndarray,
+        tolerance: float = None,
+        blocks: np.ndarray = None,
+    ):
+        return cls.factorize(k)(y)
+
+    @classmethod
+    def solve_batch(
+        cls,
+        k: np.ndarray,
+        y: np.ndarray,
+        tolerance: float = None,
+        blocks: np.ndarray = None,
+    ):
+        return cls.factorize(k)(y)
+
+    @staticmethod
+    def factorize(k: np.ndarray):
+        raise NotImplementedError
+
+
+class Cholesky_method(Direct_method):
+    @staticmethod
+    def factorize(k: np.ndarray):
+        if issparse(k):
+            k = k.toarray()
+
+        factor = cho_factor(k)
+
+        return lambda y: cho_solve(factor, y)
+
+
+class LU_method(Direct_method):
     @staticmethod
-    def _xi(k: np.ndarray, x: np.ndarray, y: np.ndarray, i: int):
-        return (y[i] - (k[i, :].dot(x) - k[i, i] * x[i])) / k[i, i]
+    def factorize(k: np.ndarray):
+        if issparse(k):
+            k = k.toarray()
+
+        factor = lu_factor(k)
 
+        return lambda y: lu_solve(factor, y)
+
+
+class BandedCholesky_method(Direct_method):
     @staticmethod
-    def _get_err(x: float, xi: float):
-        return np.abs((xi - x) / xi)
+    def factorize(k: np.ndarray):
+        upper = triu(csr_matrix(k)).tocoo()
+        bandwidth = np.max(upper.col - upper.row, initial=0)
+        banded = np.zeros((bandwidth + 1, k.shape[0]))
+        banded[bandwidth + upper.row - upper.col, upper.col] = upper.data
+
+        factor = cholesky_banded(banded)
+
+        if np.any(factor[-1] ** 2 <= 16 * np.finfo(np.float64).eps * banded[-1]):
+            raise np.linalg.LinAlgError("Matrix is singular")
+
+        return lambda y: cho_solve_banded((factor, False), y)
+
+
+class SparseCholesky_method(Direct_method):
+    reorders = True
+
+    @staticmethod
+    def factorize(k: np.ndarray):
+        factor = splu(
+            csc_matrix(k),
+            permc_spec="MMD_AT_PLUS_A",
+            diag_pivot_thresh=0.0,
+            options={"SymmetricMode": True},
+        )
+
+        return factor.solve
+
+
+class SparseLU_method(Direct_method):
+    reorders = True
+
+    @staticmethod
+    def factorize(k: np.ndarray):
+        factor = splu(csc_matrix(k), permc_spec="COLAMD")
+
+        return factor.solve
+
+
+class ConjugateGradient_method(Iterative_method):
+    preconditioner: Preconditioner
+
+    def __init__(
+        self,
+        preconditioner: Preconditioner = Jacobi_preconditioner,
+        x0: np.ndarray = None,
+        warm_start: bool = False,
+        max_iterations: int = None,
+    ):
+        super().__init__(x0, warm_start, max_iterations)
+
+        if isinstance(preconditioner, type):
+            preconditioner = preconditioner()
+
+        self.preconditioner = preconditioner
+
+    def solve_from(
+        self,
+        x: np.ndarray,
+        k: np.ndarray,
+        y: np.ndarray,
+        tolerance: float = 1e-10,
+        blocks: np.ndarray = None,
+    ):
+        M = self.preconditioner.build(k)
+        x = np.array(x, dtype=np.float64)
+        max_iterations = self.max_iterations or 10 * y.shape[0]
+
+        r = y - k @ x
+        z = M(r)
+        p = z.copy()
+        rz = r.dot(z)
+        norm = np.linalg.norm(y) or 1.0
+
+        self.residuals = [np.linalg.norm(r) / norm]
+        self.iterations = 0
+
+        while self.residuals[-1] > tolerance and self.iterations < max_iterations:
+            kp = k @ p
+            alpha = rz / p.dot(kp)
+            x += alpha * p
+            r -= alpha * kp
+            z = M(r)
+            rz, rz_old = r.dot(z), rz
+            p = z + (rz / rz_old) * p
+
+            self.iterations += 1
+            self.residuals.append(np.linalg.norm(r) / norm)
+
+        self.converged = self.residuals[-1] <= tolerance
+        self.x = x
+
+        return x
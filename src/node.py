@@ -4,29 +4,67 @@ import numpy as np
 
 from .displacement import Displacement
 from .force import Force
+from .store import Store
 
 
 class Node:
-    id: int
-    x: float
-    y: float
-    forces: List[Force]
-    displacement: Displacement
+    __slots__ = ("_store", "_index")
 
     def __init__(self, x: float, y: float):
-        self.x = x
-        self.y = y
-        self.forces = []
-        self.displacement = Displacement()
+        self._store = Store.detached(nodes={"coordinates": (x, y)})
+        self._index = 0
+
+    @classmethod
+    def _view(cls, store: Store, index: int):
+        node = cls.__new__(cls)
+        node._store = store
+        node._index = index
+
+        return node
 
     @property
-    def resultant_force(self):
-        r_x = 0
-        r_y = 0
+    def id(self) -> int:
+        return self._index
+
+    @property
+    def _version(self) -> int:
+        return self._store.nodes.value("version", self._index)
+
+    @property
+    def x(self) -> float:
+        return self._store.nodes["coordinates"][self._index, 0]
+
+    @x.setter
+    def x(self, x: float):
+        self._store.nodes["coordinates"][self._index, 0] = x
+        self._store.nodes["version"][self._index] += 1
+
+    @property
+    def y(self) -> float:
+        return self._store.nodes["coordinates"][self._index, 1]
 
-        for force in self.forces:
-            r_x += force.x
-            r_y += force.y
+    @y.setter
+    def y(self, y: float):
+        self._store.nodes["coordinates"][self._index, 1] = y
+        self._store.nodes["version"][self._index] += 1
+
+    @property
+    def forces(self) -> List[Force]:
+        forces = self._store.nodes["forces"]
+
+        if forces[self._index] is None:
+            loads = self._store.nodes["loads"][self._index]
+            forces[self._index] = [Force(*loads)] if np.any(loads) else []
+
+        return forces[self._index]
+
+    @property
+    def displacement(self) -> Displacement:
+        return Displacement(self)
+
+    @property
+    def resultant_force(self):
+        r_x, r_y = self._store.nodes["loads"][self._index]
 
         return Force(r_x, r_y)
 
@@ -49,8 +87,8 @@ class Node:
         return self
 
     def add_force(self, force: Force):
-        if force not in self.forces:
-            self.forces.append(force)
+        self.forces.append(force)
+        self._store.nodes["loads"][self._index] += (force.x, force.y)
 
         return self
 
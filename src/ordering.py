@@ -0,0 +1,62 @@
+import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import reverse_cuthill_mckee
+
+
+class Ordering:
+    def permutation(self, coordinates: np.ndarray, connectivity: np.ndarray):
+        raise NotImplementedError
+
+    @staticmethod
+    def graph(size: int, connectivity: np.ndarray):
+        rows = np.concatenate((connectivity[:, 0], connectivity[:, 1]))
+        cols = np.concatenate((connectivity[:, 1], connectivity[:, 0]))
+
+        return coo_matrix(
+            (np.ones(rows.shape[0], dtype=np.int8), (rows, cols)), shape=(size, size)
+        ).tocsr()
+
+
+class Natural_ordering(Ordering):
+    def permutation(self, coordinates: np.ndarray, connectivity: np.ndarray):
+        return np.arange(coordinates.shape[0])
+
+
+class ReverseCuthillMcKee_ordering(Ordering):
+    def permutation(self, coordinates: np.ndarray, connectivity: np.ndarray):
+        graph = Ordering.graph(coordinates.shape[0], connectivity)
+
+        return reverse_cuthill_mckee(graph, symmetric_mode=True).astype(np.intp)
+
+
+class NestedDissection_ordering(Ordering):
+    leaf_size: int
+
+    def __init__(self, leaf_size: int = 64):
+        self.leaf_size = leaf_size
+
+    def permutation(self, coordinates: np.ndarray, connectivity: np.ndarray):
+        graph = Ordering.graph(coordinates.shape[0], connectivity)
+        order = []
+
+        self._dissect(np.arange(coordinates.shape[0]), coordinates, graph, order)
+
+        return np.concatenate(order).astype(np.intp)
+
+    def _dissect(self, nodes: np.ndarray, coordinates: np.ndarray, graph, order: list):
+        if nodes.shape[0] <= self.leaf_size:
+            order.append(nodes)
+
+            return
+
+        points = coordinates[nodes]
+        axis = np.argmax(np.ptp(points, axis=0))
+        right = np.zeros(nodes.shape[0], dtype=np.bool_)
+        right[np.argsort(points[:, axis], kind="stable")[nodes.shape[0] // 2 :]] = True
+
+        coupled = graph[nodes][:, nodes] @ right.astype(np.int8)
+        separator = ~right & (coupled > 0)
+
+        self._dissect(nodes[~right & ~separator], coordinates, graph, order)
+        self._dissect(nodes[right], coordinates, graph, order)
+        order.append(nodes[separator])
@@ -0,0 +1,21 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+
+class Parallel:
+    chunk_size: int = 1 << 16
+
+    @staticmethod
+    def map(function: Callable[[slice], object], size: int, threads: int = 1):
+        chunk_size = Parallel.chunk_size
+
+        if threads <= 1 or size <= chunk_size:
+            return [function(slice(0, size))]
+
+        parts = [
+            slice(start, min(start + chunk_size, size))
+            for start in range(0, size, chunk_size)
+        ]
+
+        with ThreadPoolExecutor(threads) as executor:
+            return list(executor.map(function, parts))
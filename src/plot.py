@@ -1,112 +1,189 @@
-from typing import List, Tuple, Type
+from typing import TYPE_CHECKING, Type
 
-import matplotlib as mpl
 import numpy as np
-from matplotlib import pyplot as plt
-from matplotlib.colors import Colormap, TwoSlopeNorm
 
-from .beam import Beam
-from .force import Force
-from .node import Node
+from .assembly import Assembly
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.colors import Colormap, TwoSlopeNorm
 
 
 class Plot:
+    SUPPORT_MARKERS = {
+        (True, True): "X",
+        (True, False): ">",
+        (False, True): "^",
+        (False, False): "o",
+    }
+
+    def plot(
+        self,
+        show_nodes: bool = True,
+        show_labels: bool = True,
+        color: str = None,
+        values: np.ndarray = None,
+        cmap: Type["Colormap"] = None,
+        norm: Type["TwoSlopeNorm"] = None,
+        scale_label: str = None,
+        max_labels: int = 200,
+    ):
+        return Plot.execute(
+            self,
+            show_nodes,
+            show_labels,
+            color,
+            values,
+            cmap,
+            norm,
+            scale_label,
+            max_labels,
+        )
+
     def execute(
         self,
         show_nodes: bool,
         show_labels: bool,
         color: str,
         values: np.ndarray,
-        cmap: Type[Colormap],
-        norm: Type[TwoSlopeNorm],
+        cmap: Type["Colormap"],
+        norm: Type["TwoSlopeNorm"],
         scale_label: str,
+        max_labels: int = 200,
     ):
+        from matplotlib import pyplot as plt
+
+        ax = plt.gca()
+        store = self.store
+        coordinates = store.nodes["coordinates"]
+        segments = coordinates[store.beams["connectivity"]]
+
         if values is not None:
-            self._execute_color_scale(values, cmap, norm, scale_label)
+            colors = self._execute_color_scale(ax, values, cmap, norm, scale_label)
+        else:
+            colors = color or (
+                list(store.beams["color"])
+                if store.beams.allocated("color")
+                else store.beams.value("color", 0)
+            )
+
+        beams = Plot._execute_beams(ax, segments, colors)
 
-        for beam in self.beams:
-            label = (
-                None
-                if not show_labels
-                else values[beam.id]
+        if show_labels:
+            labels = (
+                values
                 if values is not None
-                else beam.length
+                else Assembly.geometry(coordinates, store.beams["connectivity"])[2]
             )
 
-            Plot._execute_beam(beam, color, label)
+            Plot._execute_beam_labels(ax, segments, labels, max_labels)
 
         if show_nodes:
-            for node in self.nodes:
-                Plot._execute_node(node, zorder=2)
+            Plot._execute_nodes(ax, coordinates, store.nodes["supports"], zorder=2)
+            Plot._execute_node_forces(ax, coordinates, store.nodes["loads"], zorder=3)
+
+        return beams
 
     def _execute_color_scale(
         self,
+        ax: "Axes",
         values: np.ndarray,
-        cmap: Type[Colormap],
-        norm: Type[TwoSlopeNorm],
+        cmap: Type["Colormap"],
+        norm: Type["TwoSlopeNorm"],
         label: str,
     ):
+        from matplotlib import colormaps
+        from matplotlib.cm import ScalarMappable
+        from matplotlib.colors import TwoSlopeNorm
+
+        cmap = cmap or colormaps["rainbow"]
+
         if norm is None:
             norm = TwoSlopeNorm(
-                vmin=values.min(),
+                vmin=min(values.min(), -np.finfo(float).eps),
                 vcenter=0.0,
-                vmax=values.max(),
+                vmax=max(values.max(), np.finfo(float).eps),
             )
 
-        for beam in self.beams:
-            value = values[beam.id]
-            color = cmap(norm(value))
+        sm = ScalarMappable(cmap=cmap, norm=norm)
 
-            beam.set_color(color)
+        ax.figure.colorbar(sm, ax=ax, label=label)
 
-        sm = plt.cm.ScalarMappable(cmap=cmap, norm=norm)
-
-        plt.colorbar(sm, label=label)
+        return cmap(norm(values))
 
     @staticmethod
-    def _execute_beam(beam: Beam, color: str, label: str):
+    def _execute_beams(ax: "Axes", segments: np.ndarray, colors):
+        from matplotlib.collections import LineCollection
 
-        plt.plot(
-            [beam.node1.x, beam.node2.x],
-            [beam.node1.y, beam.node2.y],
-            c=color or beam.color,
-        )
+        beams = LineCollection(segments, colors=colors)
 
-        if label != None:
-            Plot._execute_beam_label(beam, label)
+        ax.add_collection(beams)
+        ax.autoscale_view()
 
-    @staticmethod
-    def _execute_beam_label(beam: Beam, label: str):
-        cx, cy = beam.center
-        alpha = np.degrees(beam.angle)
-
-        if alpha < -90 and alpha > -270:
-            alpha += 180
-
-        plt.text(
-            cx,
-            cy,
-            f"{label:.2f}",
-            horizontalalignment="center",
-            verticalalignment="center",
-            rotation=alpha,
-        )
+        return beams
 
     @staticmethod
-    def _execute_node(node: Node, zorder: int):
-        dx, dy = node.displacement.vec
-        marker = "X" if dx and dy else ">" if dx else "^" if dy else "o"
-
-        plt.scatter([node.x], [node.y], c="#27B", marker=marker, zorder=zorder)
-
-        if len(node.forces) > 0:
-            Plot._execute_node_force((node.x, node.y), node.resultant_force, zorder + 1)
+    def _execute_beam_labels(
+        ax: "Axes", segments: np.ndarray, labels: np.ndarray, max_labels: int
+    ):
+        delta = segments[:, 0] - segments[:, 1]
+        length = np.hypot(delta[:, 0], delta[:, 1])
+        shown = np.flatnonzero(length > 0.0)
+
+        if max_labels is not None and shown.shape[0] > max_labels:
+            shown = shown[np.argsort(-length[shown], kind="stable")[:max_labels]]
+
+        centers = segments[shown].mean(axis=1)
+        alpha = np.degrees(np.arctan2(delta[shown, 1], delta[shown, 0]) - np.pi)
+        alpha[(alpha < -90) & (alpha > -270)] += 180
+
+        for (cx, cy), angle, label in zip(centers, alpha, labels[shown]):
+            ax.text(
+                cx,
+                cy,
+                f"{label:.2f}",
+                horizontalalignment="center",
+                verticalalignment="center",
+                rotation=angle,
+            )
 
     @staticmethod
-    def _execute_node_force(origin: Tuple[float, float], force: Force, zorder: int):
-        arrow = mpl.markers.MarkerStyle(marker=5)
-        arrow._transform = arrow.get_transform().rotate_deg(force.angle)
+    def _execute_nodes(
+        ax: "Axes", coordinates: np.ndarray, supports: np.ndarray, zorder: int
+    ):
+        for (dx, dy), marker in Plot.SUPPORT_MARKERS.items():
+            group = (supports[:, 0] == dx) & (supports[:, 1] == dy)
+
+            if np.any(group):
+                ax.scatter(
+                    coordinates[group, 0],
+                    coordinates[group, 1],
+                    c="#27B",
+                    marker=marker,
+                    zorder=zorder,
+                )
 
-        plt.scatter(
-            [origin[0]], [origin[1]], c="#B22", marker=arrow, s=100, zorder=zorder
+    @staticmethod
+    def _execute_node_forces(
+        ax: "Axes", coordinates: np.ndarray, loads: np.ndarray, zorder: int
+    ):
+        loaded = np.flatnonzero(np.any(loads != 0.0, axis=1))
+
+        if loaded.shape[0] == 0:
+            return
+
+        direction = loads[loaded] / np.hypot(*loads[loaded].T)[:, None]
+
+        ax.quiver(
+            coordinates[loaded, 0],
+            coordinates[loaded, 1],
+            direction[:, 0],
+            direction[:, 1],
+            color="#B22",
+            pivot="middle",
+            scale=20,
+            width=0.006,
+            headlength=4,
+            headaxislength=3.5,
+            zorder=zorder,
         )
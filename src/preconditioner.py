@@ -0,0 +1,63 @@
+import numpy as np
+from scipy.sparse import csc_matrix, csr_matrix, diags, tril, triu
+from scipy.sparse.linalg import spilu, spsolve_triangular
+
+
+class Preconditioner:
+    def build(self, k: np.ndarray):
+        raise NotImplementedError
+
+
+class Identity_preconditioner(Preconditioner):
+    def build(self, k: np.ndarray):
+        return lambda r: r
+
+
+class Jacobi_preconditioner(Preconditioner):
+    def build(self, k: np.ndarray):
+        inverse = 1.0 / k.diagonal()
+
+        return lambda r: inverse * r
+
+
+class IncompleteCholesky_preconditioner(Preconditioner):
+    drop_tolerance: float
+    fill_factor: float
+
+    def __init__(self, drop_tolerance: float = 1e-4, fill_factor: float = 10.0):
+        self.drop_tolerance = drop_tolerance
+        self.fill_factor = fill_factor
+
+    def build(self, k: np.ndarray):
+        factor = spilu(
+            csc_matrix(k),
+            drop_tol=self.drop_tolerance,
+            fill_factor=self.fill_factor,
+            permc_spec="MMD_AT_PLUS_A",
+            diag_pivot_thresh=0.0,
+            options={"SymmetricMode": True},
+        )
+
+        return factor.solve
+
+
+class SSOR_preconditioner(Preconditioner):
+    omega: float
+
+    def __init__(self, omega: float = 1.0):
+        self.omega = omega
+
+    def build(self, k: np.ndarray):
+        k = csr_matrix(k)
+        diagonal = k.diagonal() / self.omega
+        scale = 2.0 - self.omega
+        lower = csr_matrix(tril(k, -1) + diags(diagonal))
+        upper = csr_matrix(triu(k, 1) + diags(diagonal))
+
+        def apply(r: np.ndarray):
+            z = spsolve_triangular(lower, r, lower=True)
+            z = spsolve_triangular(upper, diagonal * z, lower=False)
+
+            return scale * z
+
+        return apply
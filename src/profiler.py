@@ -0,0 +1,121 @@
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List
+
+import numpy as np
+from scipy.sparse import issparse
+
+from .method import Iterative_method
+
+
+class Profiler:
+    callbacks: List[Callable[[dict], None]]
+    memory: bool
+    records: List[dict]
+
+    def __init__(
+        self,
+        solve=None,
+        callbacks: Iterable[Callable[[dict], None]] = (),
+        memory: bool = True,
+    ):
+        self.solve = solve
+        self.callbacks = list(callbacks)
+        self.memory = memory
+        self.records = []
+        self._tracing = False
+
+    def __enter__(self):
+        if self.solve is not None:
+            self.solve.profiler = self
+
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+
+        return self
+
+    def __exit__(self, *args):
+        if self.solve is not None and self.solve.profiler is self:
+            self.solve.profiler = None
+
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
+
+    @contextmanager
+    def stage(self, name: str, solve):
+        tracing = tracemalloc.is_tracing()
+
+        if tracing:
+            tracemalloc.reset_peak()
+            current = tracemalloc.get_traced_memory()[0]
+
+        start = time.perf_counter()
+
+        yield
+
+        record = {"stage": name, "time": time.perf_counter() - start}
+
+        if tracing:
+            record["memory"] = tracemalloc.get_traced_memory()[1] - current
+
+        record.update(Profiler.get_telemetry(name, solve))
+
+        self.records.append(record)
+
+        for callback in self.callbacks:
+            callback(record)
+
+    def get_totals(self, field: str = "time"):
+        totals: Dict[str, float] = {}
+
+        for record in self.records:
+            if field in record:
+                totals[record["stage"]] = totals.get(record["stage"], 0) + record[field]
+
+        return totals
+
+    @staticmethod
+    def get_telemetry(name: str, solve):
+        if name in ("rigidity", "rigidity_update"):
+            k = solve._rigidity
+
+            return {
+                "size": k.shape[0],
+                "nnz": k.nnz if issparse(k) else int(np.count_nonzero(k)),
+            }
+
+        if name == "mask":
+            return {"dofs": int(np.count_nonzero(solve._mask_n))}
+
+        if name in ("displacement", "displacement_update", "cases"):
+            method = solve.method
+            telemetry = {"method": type(method).__name__}
+
+            if isinstance(method, Iterative_method):
+                telemetry.update(
+                    iterations=method.iterations,
+                    residual=float(method.residuals[-1]) if method.residuals else None,
+                    converged=bool(method.converged),
+                )
+            elif name != "cases":
+                residual = Profiler.get_residual(solve)
+                telemetry.update(
+                    iterations=0,
+                    residual=residual,
+                    converged=bool(residual <= solve.tolerance),
+                )
+
+            return telemetry
+
+        return {}
+
+    @staticmethod
+    def get_residual(solve):
+        mask_n = solve._mask_n
+        y = solve._forces[mask_n]
+        r = (solve._rigidity @ solve._displacement)[mask_n] - y
+
+        return float(np.linalg.norm(r) / (np.linalg.norm(y) or 1.0))
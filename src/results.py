@@ -0,0 +1,118 @@
+import os
+from typing import BinaryIO, Dict, Sequence
+
+import numpy as np
+
+
+class Results:
+    path: str
+
+    FIELDS = (
+        "displacement",
+        "forces",
+        "internal_deformation",
+        "internal_tension",
+        "internal_forces",
+    )
+
+    def __init__(self, path: str):
+        os.makedirs(path, exist_ok=True)
+
+        self.path = path
+        self._files: Dict[str, BinaryIO] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def append(self, **values):
+        for name, value in values.items():
+            value = np.asarray(value, dtype=np.float64).reshape(-1)
+
+            self._write(name, value, np.array([value.shape[0]]))
+
+        return self
+
+    def extend(self, **columns):
+        for name, rows in columns.items():
+            if isinstance(rows, np.ndarray) and rows.dtype != object:
+                rows = np.asarray(rows, dtype=np.float64).reshape(rows.shape[0], -1)
+                sizes = np.full(rows.shape[0], rows.shape[1])
+            else:
+                rows = [np.asarray(row, dtype=np.float64).reshape(-1) for row in rows]
+                sizes = np.array([row.shape[0] for row in rows])
+                rows = np.concatenate(rows) if rows else np.zeros(0)
+
+            self._write(name, rows, sizes)
+
+        return self
+
+    def append_solution(self, solution, fields: Sequence[str] = FIELDS, **values):
+        values.update((name, getattr(solution, name)) for name in fields)
+
+        return self.append(**values)
+
+    def extend_cases(self, cases, fields: Sequence[str] = FIELDS, **columns):
+        aliases = {"displacement": "displacements"}
+
+        columns.update(
+            (name, getattr(cases, aliases.get(name, name))) for name in fields
+        )
+
+        return self.extend(**columns)
+
+    def flush(self):
+        for handle in self._files.values():
+            handle.flush()
+
+        return self
+
+    def close(self):
+        for handle in self._files.values():
+            handle.close()
+
+        self._files.clear()
+
+    def _write(self, name: str, data: np.ndarray, sizes: np.ndarray):
+        if name not in self._files:
+            self._files[name] = open(os.path.join(self.path, f"{name}.f8"), "ab")
+            self._files[f"{name}.rows"] = open(
+                os.path.join(self.path, f"{name}.rows"), "ab"
+            )
+
+        np.ascontiguousarray(data, dtype="<f8").tofile(self._files[name])
+        np.asarray(sizes, dtype="<i8").tofile(self._files[f"{name}.rows"])
+
+    @staticmethod
+    def read(path: str, mmap: bool = True):
+        columns = {}
+
+        for entry in sorted(os.listdir(path)):
+            name, extension = os.path.splitext(entry)
+
+            if extension != ".f8":
+                continue
+
+            sizes = np.fromfile(os.path.join(path, f"{name}.rows"), dtype="<i8")
+            data = os.path.join(path, entry)
+            data = (
+                np.memmap(data, dtype="<f8", mode="r")
+                if mmap and os.path.getsize(data) > 0
+                else np.fromfile(data, dtype="<f8")
+            )
+
+            if sizes.shape[0] > 0 and np.all(sizes == 1):
+                columns[name] = data
+            elif sizes.shape[0] > 0 and np.all(sizes == sizes[0]):
+                columns[name] = data.reshape(sizes.shape[0], sizes[0])
+            else:
+                column = np.empty(sizes.shape[0], dtype=object)
+
+                for i, row in enumerate(np.split(data, np.cumsum(sizes)[:-1])):
+                    column[i] = row
+
+                columns[name] = column
+
+        return columns
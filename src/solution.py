@@ -0,0 +1,80 @@
+from typing import List
+
+import numpy as np
+
+from .beam import Beam
+from .node import Node
+from .plot import Plot
+from .store import Store
+
+
+class Solution(Plot):
+    coordinates: np.ndarray
+    displacement: np.ndarray
+    forces: np.ndarray
+    internal_deformation: np.ndarray
+    internal_tension: np.ndarray
+    internal_forces: np.ndarray
+    internal_energy: np.ndarray
+    utilization: np.ndarray
+    buckling: np.ndarray
+
+    def __init__(
+        self,
+        truss,
+        coordinates: np.ndarray,
+        displacement: np.ndarray,
+        forces: np.ndarray,
+        internal_deformation: np.ndarray,
+        internal_tension: np.ndarray,
+        internal_forces: np.ndarray,
+        internal_energy: np.ndarray,
+        utilization: np.ndarray,
+        buckling: np.ndarray,
+    ):
+        self.truss = truss
+        self.coordinates = coordinates
+        self.displacement = displacement
+        self.forces = forces
+        self.internal_deformation = internal_deformation
+        self.internal_tension = internal_tension
+        self.internal_forces = internal_forces
+        self.internal_energy = internal_energy
+        self.utilization = utilization
+        self.buckling = buckling
+        self._store = None
+
+    @property
+    def store(self) -> Store:
+        if self._store is None:
+            self._store = Solution._make_store(self.truss.store, self.coordinates)
+
+        return self._store
+
+    @property
+    def nodes(self) -> List[Node]:
+        return self.store.nodes.views
+
+    @property
+    def beams(self) -> List[Beam]:
+        return self.store.beams.views
+
+    def plot_deformation(self, *args, **kwargs):
+        self.plot(values=self.internal_deformation, *args, **kwargs)
+
+    def plot_tension(self, *args, **kwargs):
+        self.plot(values=self.internal_tension, *args, **kwargs)
+
+    def plot_force(self, *args, **kwargs):
+        self.plot(values=self.internal_forces, *args, **kwargs)
+
+    def plot_utilization(self, *args, **kwargs):
+        self.plot(values=self.utilization, *args, **kwargs)
+
+    @staticmethod
+    def _make_store(origin: Store, coordinates: np.ndarray):
+        store = origin.copy()
+        store.nodes["coordinates"][:] = coordinates
+        store.nodes["version"][:] += 1
+
+        return store
@@ -1,32 +1,207 @@
-from copy import deepcopy
+from contextlib import nullcontext
 
 import numpy as np
-
-from .method import Method
+from scipy.sparse import csc_matrix, issparse
+
+from .assembly import Assembly
+from .cases import Cases
+from .factorization import Factorization
+from .method import (
+    ConvergenceError,
+    Direct_method,
+    GaussSeidel_method,
+    Iterative_method,
+    Method,
+)
+from .ordering import Ordering
+from .parallel import Parallel
+from .profiler import Profiler
+from .solution import Solution
+from .stability import Stability
 
 
 class Solve:
+    method: Method
+    ordering: Ordering
+    threads: int
+    tolerance: float
+    profiler: Profiler
     internal_deformation: np.ndarray
     internal_tension: np.ndarray
     internal_forces: np.ndarray
+    internal_energy: np.ndarray
+    utilization: np.ndarray
+    buckling: np.ndarray
 
     def __init__(self):
         self.solution = self
+        self._factorization = None
+        self._permutation = None
+        self._updatable = False
+        self.threads = 1
+        self.profiler = None
+
+    def execute(
+        self,
+        charge: float,
+        method: Method,
+        tolerance: float,
+        sparse: bool,
+        ordering: Ordering = None,
+    ):
+        self.tolerance = tolerance
+        self._updatable = False
+
+        with self._stage("geometry"):
+            self._execute_geometry()
+        with self._stage("rigidity"):
+            self._execute_rigidity(sparse)
+        with self._stage("mask"):
+            self._execute_mask()
+        with self._stage("stability"):
+            self._execute_stability()
+        with self._stage("ordering"):
+            self._execute_ordering(ordering, method)
+        with self._stage("forces"):
+            self._execute_forces(charge)
+        with self._stage("displacement"):
+            self._execute_displacement(method, tolerance)
+
+        self._execute_convergence()
+
+        with self._stage("results"):
+            self._execute_results()
+
+        self._updatable = True
+
+        return self
 
-    def execute(self, charge: float, method: Method, tolerance: float):
-        self.solution = deepcopy(self)
+    def execute_update(self, charge: float, tolerance: float, max_rank: int):
+        if not self._updatable:
+            method = getattr(self, "method", GaussSeidel_method)
+            ordering = getattr(self, "ordering", None)
 
-        self._execute_rigidity()
-        self._execute_mask()
-        self._execute_forces(charge)
-        self._execute_displacement(method, tolerance)
-        self._execute_reactions()
-        self._execute_internal_deformation()
-        self._execute_internal_tension()
-        self._execute_internal_force()
+            return Solve.execute(self, charge, method, tolerance, True, ordering)
+
+        self._updatable = False
+
+        with self._stage("rigidity_update"):
+            updated = self._execute_rigidity_update()
+
+        if not updated:
+            return Solve.execute(
+                self,
+                charge,
+                self.method,
+                tolerance,
+                issparse(self._rigidity),
+                self.ordering,
+            )
+
+        mask = self._mask
+        self.tolerance = tolerance
+
+        with self._stage("mask"):
+            self._execute_mask()
+        with self._stage("stability"):
+            self._execute_stability()
+
+        factorized = np.array_equal(mask, self._mask)
+
+        if not factorized:
+            with self._stage("ordering"):
+                self._execute_ordering(self.ordering, self.method)
+
+        with self._stage("forces"):
+            self._execute_forces(charge)
+        with self._stage("displacement_update"):
+            self._execute_displacement_update(tolerance, max_rank, factorized)
+
+        self._execute_convergence()
+
+        with self._stage("results"):
+            self._execute_results()
+
+        self._updatable = True
 
         return self
 
+    def _execute_results(self):
+        self._execute_reactions()
+        self._execute_internal()
+
+        self.solution = Solution(
+            self,
+            self._displaced,
+            self._displacement,
+            self._forces,
+            self.internal_deformation,
+            self.internal_tension,
+            self.internal_forces,
+            self.internal_energy,
+            self.utilization,
+            self.buckling,
+        )
+
+    def execute_cases(
+        self,
+        charges: np.ndarray,
+        forces: np.ndarray,
+        method: Method,
+        tolerance: float,
+        sparse: bool,
+        ordering: Ordering = None,
+    ):
+        if isinstance(method, type):
+            method = method()
+
+        self._updatable = False
+        self.tolerance = tolerance
+
+        with self._stage("geometry"):
+            self._execute_geometry()
+        with self._stage("rigidity"):
+            self._execute_rigidity(sparse)
+        with self._stage("mask"):
+            self._execute_mask()
+        with self._stage("stability"):
+            self._execute_stability()
+        with self._stage("ordering"):
+            self._execute_ordering(ordering, method)
+
+        with self._stage("forces"):
+            if forces is None:
+                F = np.multiply.outer(
+                    np.asarray(charges, dtype=np.float64), self._get_forces()
+                )
+            else:
+                F = np.array(forces, dtype=np.float64).reshape(len(forces), -1)
+
+        with self._stage("cases"):
+            U = np.zeros_like(F)
+            k, blocks = self._get_reduced()
+
+            if isinstance(method, Direct_method):
+                solve = self._get_factorization(method, k)
+            else:
+                solve = self._get_permuted(
+                    lambda y: method.solve_batch(
+                        k=k, y=y, tolerance=tolerance, blocks=blocks
+                    )
+                )
+
+            U[:, self._mask_n] = solve(F[:, self._mask_n].T).T
+            F[:, self._mask] = (self._rigidity[self._mask] @ U.T).T - F[:, self._mask]
+
+            self.method = method
+
+        self._execute_convergence()
+
+        with self._stage("results"):
+            displaced = self._coordinates + U.reshape(U.shape[0], -1, 2)
+
+            return Cases(U, F, self._mask, *self._get_internal(displaced, U))
+
     def plot_deformation(self, *args, **kwargs):
         self.solution.plot(values=self.internal_deformation, *args, **kwargs)
 
@@ -36,92 +211,349 @@ class Solve:
     def plot_force(self, *args, **kwargs):
         self.solution.plot(values=self.internal_forces, *args, **kwargs)
 
+    def plot_utilization(self, *args, **kwargs):
+        self.solution.plot(values=self.utilization, *args, **kwargs)
+
+    def execute_stability(self, tolerance: float = 1e-12):
+        coordinates, connectivity, elasticity, area = self._get_arrays()
+        rigidity = Assembly.execute(
+            coordinates, connectivity, elasticity, area, True, self.threads
+        )
+
+        Stability.execute(
+            connectivity, self.store.nodes["supports"], rigidity, tolerance, True
+        )
+
+        return self
+
+    def _stage(self, name: str):
+        if self.profiler is None:
+            return _disabled
+
+        return self.profiler.stage(name, self)
+
     def _execute_mask(self):
-        self._mask = np.array(
-            [node.displacement.vec for node in self.solution.nodes]
-        ).flatten()
+        self._mask = self.store.nodes["supports"].flatten()
         self._mask_n = np.bitwise_not(self._mask)
 
-    def _execute_rigidity(self):
-        size = len(self.solution.nodes)
-        K = np.zeros((size * 2, size * 2))
+    def _execute_convergence(self):
+        method = self.method
 
-        for beam in self.solution.beams:
-            Ke = beam.rigidity
-            i1 = beam.node1.id * 2
-            i2 = beam.node2.id * 2
+        if isinstance(method, Iterative_method) and not method.converged:
+            self._updatable = False
 
-            K[i1 : i1 + 2, i1 : i1 + 2] += Ke[0:2, 0:2]
-            K[i1 : i1 + 2, i2 : i2 + 2] += Ke[0:2, 2:4]
-            K[i2 : i2 + 2, i1 : i1 + 2] += Ke[2:4, 0:2]
-            K[i2 : i2 + 2, i2 : i2 + 2] += Ke[2:4, 2:4]
+            raise ConvergenceError(method, self.tolerance)
 
-        self._rigidity = K
+    def _execute_mechanism(self):
+        self._updatable = False
 
-    def _execute_forces(self, charge: float):
-        F = []
+        Stability.pivots(self._rigidity, self._mask.reshape(-1, 2))
+
+    def _execute_stability(self):
+        Stability.execute(self._connectivity, self._mask.reshape(-1, 2), self._rigidity)
+
+    def _execute_ordering(self, ordering: Ordering, method: Method):
+        if isinstance(ordering, type):
+            ordering = ordering()
+
+        self.ordering = ordering
+        self._permutation = None
+
+        if ordering is None or method.reorders:
+            return
+
+        nodes = ordering.permutation(self._coordinates, self._connectivity)
+        dofs = np.column_stack((nodes * 2, nodes * 2 + 1)).ravel()
+        index = np.cumsum(self._mask_n) - 1
+
+        self._permutation = index[dofs[self._mask_n[dofs]]]
+
+    def _execute_geometry(self):
+        coordinates, connectivity, self._elasticity, self._area = self._get_arrays()
+
+        self._coordinates = coordinates.copy()
+        self._connectivity = connectivity.copy()
+
+    def _execute_rigidity(self, sparse: bool):
+        self._rigidity = Assembly.execute(
+            self._coordinates,
+            self._connectivity,
+            self._elasticity,
+            self._area,
+            sparse,
+            self.threads,
+        )
+        self._keys = None
+
+    def _execute_rigidity_update(self):
+        coordinates, connectivity, elasticity, area = self._get_arrays()
+
+        if (
+            coordinates.shape != self._coordinates.shape
+            or connectivity.shape != self._connectivity.shape
+        ):
+            return False
+
+        moved = np.flatnonzero(np.any(coordinates != self._coordinates, axis=1))
+        reshaped = np.any(connectivity != self._connectivity, axis=1)
+        reshaped |= np.isin(connectivity, moved).any(axis=1)
+        reshaped |= np.isin(self._connectivity, moved).any(axis=1)
+        stiffened = ~reshaped & (
+            (elasticity != self._elasticity) | (area != self._area)
+        )
+
+        old = np.flatnonzero(reshaped)
+        new = np.flatnonzero(reshaped | stiffened)
+        vec_old, length_old = Assembly.direction(
+            self._coordinates, self._connectivity[old]
+        )
+        vec_new, length_new = Assembly.direction(coordinates, connectivity[new])
+        k_old = self._elasticity * self._area
+        k_new = elasticity[new] * area[new] / length_new
+
+        changes = (
+            np.concatenate(
+                (
+                    Assembly.dofs(self._connectivity[old]),
+                    Assembly.dofs(connectivity[new]),
+                )
+            ),
+            np.concatenate((vec_old, vec_new)),
+            np.concatenate(
+                (
+                    -k_old[old] / length_old,
+                    k_new - k_old[new] / length_new * stiffened[new],
+                )
+            ),
+        )
+
+        if not self._update_rigidity(*changes):
+            return False
+
+        self._coordinates = coordinates.copy()
+        self._connectivity = connectivity.copy()
+        self._elasticity = elasticity
+        self._area = area
+        self._changes = changes
+
+        return True
+
+    def _update_rigidity(self, dofs: np.ndarray, vec: np.ndarray, d: np.ndarray):
+        rows = np.broadcast_to(dofs[:, :, None], (dofs.shape[0], 4, 4)).ravel()
+        cols = np.broadcast_to(dofs[:, None, :], (dofs.shape[0], 4, 4)).ravel()
+        values = (d[:, None, None] * vec[:, :, None] * vec[:, None, :]).ravel()
 
-        for node in self.solution.nodes:
-            R = node.resultant_force
+        if not issparse(self._rigidity):
+            np.add.at(self._rigidity, (rows, cols), values)
 
-            F.append(R.x)
-            F.append(R.y)
+            return True
 
-        self._forces = np.array(F) * charge
+        K = self._rigidity
+        size = K.shape[1]
+
+        if self._keys is None:
+            K.sort_indices()
+            self._keys = np.repeat(np.arange(K.shape[0]), np.diff(K.indptr)) * size
+            self._keys += K.indices
+
+        keys = rows * size + cols
+        positions = np.minimum(np.searchsorted(self._keys, keys), K.nnz - 1)
+
+        if not np.array_equal(self._keys[positions], keys):
+            return False
+
+        np.add.at(K.data, positions, values)
+
+        return True
+
+    def _execute_forces(self, charge: float):
+        self._forces = self._get_forces() * charge
 
     def _execute_displacement(self, method: Method, tolerance: float):
+        if isinstance(method, type):
+            method = method()
+
+        u = np.zeros(self._rigidity.shape[1])
+        k, blocks = self._get_reduced()
+        y = self._forces[self._mask_n]
+
+        if isinstance(method, Direct_method):
+            self._factorization = self._get_factorization(method, k)
+            u[self._mask_n] = self._factorization(y)
+        else:
+            self._factorization = None
+            u[self._mask_n] = self._get_permuted(
+                lambda y: method.solve(k=k, y=y, tolerance=tolerance, blocks=blocks)
+            )(y)
+
+        self.method = method
+        self._execute_displaced(u)
+
+    def _execute_displacement_update(
+        self, tolerance: float, max_rank: int, factorized: bool
+    ):
         u = np.zeros(self._rigidity.shape[1])
+        y = self._forces[self._mask_n]
 
-        u[self._mask_n] = method.solve(
-            k=self._rigidity[self._mask_n][:, self._mask_n],
-            y=self._forces[self._mask_n],
-            tolerance=tolerance,
-        )
+        if self._factorization is not None and factorized:
+            V, d = self._get_low_rank(*self._changes)
+
+            if self._factorization.rank + d.shape[0] <= max_rank:
+                u[self._mask_n] = self._factorization.update(V, d)(y)
+                self._execute_displaced(u)
+
+                return
 
-        for beam in self.solution.beams:
-            i1 = beam.node1.id * 2
-            i2 = beam.node2.id * 2
+        k, blocks = self._get_reduced()
 
-            beam.node1.x += u[i1]
-            beam.node1.y += u[i1 + 1]
-            beam.node2.x += u[i2]
-            beam.node2.y += u[i2 + 1]
+        if isinstance(self.method, Direct_method):
+            self._factorization = self._get_factorization(self.method, k)
+            u[self._mask_n] = self._factorization(y)
+        else:
+            x = self._displacement[self._mask_n]
 
+            if self._permutation is not None:
+                x = x[self._permutation]
+
+            u[self._mask_n] = self._get_permuted(
+                lambda y: self.method.solve_from(
+                    x, k=k, y=y, tolerance=tolerance, blocks=blocks
+                )
+            )(y)
+
+        self._execute_displaced(u)
+
+    def _execute_displaced(self, u: np.ndarray):
+        self._displaced = self._coordinates + u.reshape(-1, 2)
         self._displacement = u
 
     def _execute_reactions(self):
-        self._forces[self._mask] = np.matmul(self._rigidity, self._displacement)[
-            self._mask
-        ]
-
-    def _execute_internal_deformation(self):
-        deformations = []
-
-        for beam in self.solution.beams:
-            i1 = beam.node1.id * 2
-            i2 = beam.node2.id * 2
-            u1 = self._displacement[i1 : i1 + 2]
-            u2 = self._displacement[i2 : i2 + 2]
-            deformation = beam.get_deformation(u1, u2)
-
-            deformations.append(deformation)
-
-        self.internal_deformation = np.array(deformations)
-
-    def _execute_internal_tension(self):
-        self.internal_tension = np.array(
-            [
-                deformation * beam.material.elasticity
-                for deformation, beam in zip(
-                    self.internal_deformation, self.solution.beams
-                )
-            ]
+        self._forces[self._mask] = (
+            self._rigidity[self._mask] @ self._displacement - self._forces[self._mask]
         )
 
-    def _execute_internal_force(self):
-        self.internal_forces = np.array(
-            [
-                tension * beam.material.area
-                for tension, beam in zip(self.internal_tension, self.solution.beams)
-            ]
+    def _execute_internal(self):
+        (
+            self.internal_deformation,
+            self.internal_tension,
+            self.internal_forces,
+            self.internal_energy,
+            self.utilization,
+            self.buckling,
+        ) = self._get_internal(self._displaced, self._displacement)
+
+    def _get_internal(self, displaced: np.ndarray, displacement: np.ndarray):
+        connectivity = self._connectivity
+        elasticity, area = self._elasticity, self._area
+        yield_stress = self.store.get_material_array("yield_stress")
+        inertia = self.store.get_material_array("inertia")
+        results = tuple(
+            np.empty((*displacement.shape[:-1], connectivity.shape[0]))
+            for _ in range(6)
         )
+
+        def internal(part: slice):
+            values = Assembly.internal(
+                self._coordinates,
+                displaced,
+                connectivity[part],
+                displacement,
+                elasticity[part],
+                area[part],
+                yield_stress[part],
+                inertia[part],
+            )
+
+            for result, value in zip(results, values):
+                result[..., part] = value
+
+        Parallel.map(internal, connectivity.shape[0], self.threads)
+
+        return results
+
+    def _get_low_rank(self, dofs: np.ndarray, vec: np.ndarray, d: np.ndarray):
+        index = np.full(self._mask.shape[0], -1)
+        index[self._mask_n] = np.arange(np.count_nonzero(self._mask_n))
+        rows = index[dofs]
+        free = rows >= 0
+        columns = np.flatnonzero(free.any(axis=1) & (d != 0.0))
+        rows, free, vec = rows[columns], free[columns], vec[columns]
+
+        V = csc_matrix(
+            (
+                vec[free],
+                (
+                    rows[free],
+                    np.broadcast_to(np.arange(columns.shape[0])[:, None], free.shape)[
+                        free
+                    ],
+                ),
+            ),
+            shape=(index.max() + 1, columns.shape[0]),
+        )
+
+        return V, d[columns]
+
+    def _get_reduced(self):
+        k = self._rigidity[self._mask_n][:, self._mask_n]
+        blocks = np.repeat(np.arange(self._mask.shape[0] // 2), 2)[self._mask_n]
+        permutation = self._permutation
+
+        if permutation is None:
+            return k, blocks
+
+        _, first, inverse = np.unique(
+            blocks[permutation], return_index=True, return_inverse=True
+        )
+        order = np.empty_like(first)
+        order[np.argsort(first)] = np.arange(first.shape[0])
+
+        return k[permutation][:, permutation], order[inverse]
+
+    def _get_factorization(self, method: Direct_method, k: np.ndarray):
+        try:
+            solve = method.factorize(k)
+        except (RuntimeError, np.linalg.LinAlgError):
+            self._execute_mechanism()
+
+            raise
+
+        def checked(y: np.ndarray):
+            x = solve(y)
+
+            if not np.all(np.isfinite(x)):
+                self._execute_mechanism()
+
+            return x
+
+        return Factorization(self._get_permuted(checked), k.shape[0])
+
+    def _get_permuted(self, solve):
+        permutation = self._permutation
+
+        if permutation is None:
+            return solve
+
+        def apply(y: np.ndarray):
+            x = np.empty_like(y, dtype=np.float64)
+            x[permutation] = solve(y[permutation])
+
+            return x
+
+        return apply
+
+    def _get_arrays(self):
+        elasticity, area = self.store.get_material_arrays()
+
+        return (
+            self.store.nodes["coordinates"],
+            self.store.beams["connectivity"],
+            elasticity,
+            area,
+        )
+
+    def _get_forces(self):
+        return self.store.get_loads().ravel()
+
+
+_disabled = nullcontext()
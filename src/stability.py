@@ -0,0 +1,123 @@
+import numpy as np
+from scipy.sparse import csc_matrix, identity
+from scipy.sparse.csgraph import connected_components
+from scipy.sparse.linalg import splu
+
+from .ordering import Ordering
+
+
+class StabilityError(ValueError):
+    nodes: np.ndarray
+
+    def __init__(self, message: str, nodes: np.ndarray):
+        self.nodes = np.unique(nodes)
+
+        shown = ", ".join(str(node) for node in self.nodes[:10])
+
+        if self.nodes.shape[0] > 10:
+            shown += f", ... ({self.nodes.shape[0]} nodes)"
+
+        super().__init__(f"{message} at nodes [{shown}]")
+
+
+class Stability:
+    @staticmethod
+    def execute(
+        connectivity: np.ndarray,
+        supports: np.ndarray,
+        rigidity: np.ndarray,
+        tolerance: float = 1e-12,
+        full: bool = False,
+    ):
+        Stability.components(connectivity, supports)
+        Stability.nodes(rigidity, supports, tolerance)
+
+        if full:
+            Stability.pivots(rigidity, supports, tolerance)
+
+    @staticmethod
+    def components(connectivity: np.ndarray, supports: np.ndarray):
+        size = supports.shape[0]
+        count, labels = connected_components(
+            Ordering.graph(size, connectivity), directed=False
+        )
+        nodes = np.bincount(labels, minlength=count)
+        restrained = np.bincount(labels, weights=supports.sum(axis=1), minlength=count)
+        required = np.where(nodes > 1, 3, 2)
+        directions = np.column_stack(
+            [
+                np.bincount(labels, weights=supports[:, i], minlength=count) > 0
+                for i in range(2)
+            ]
+        )
+
+        unconnected = (nodes == 1) & (restrained < required)
+
+        if np.any(unconnected):
+            raise StabilityError(
+                "Free nodes aren't connected to any beam",
+                np.flatnonzero(unconnected[labels]),
+            )
+
+        floating = restrained == 0
+
+        if np.any(floating):
+            raise StabilityError(
+                "Beams are disconnected from the supports",
+                np.flatnonzero(floating[labels]),
+            )
+
+        unstable = (restrained < required) | ~directions.all(axis=1)
+
+        if np.any(unstable):
+            raise StabilityError(
+                "Supports don't prevent rigid body motion",
+                np.flatnonzero(unstable[labels]),
+            )
+
+    @staticmethod
+    def nodes(rigidity: np.ndarray, supports: np.ndarray, tolerance: float):
+        diagonal = rigidity.diagonal()
+        coupling = rigidity.diagonal(1)
+        kxx, kyy, kxy = diagonal[0::2], diagonal[1::2], coupling[0::2]
+        free = ~supports
+        scale = np.abs(diagonal).max(initial=0.0)
+
+        both = free[:, 0] & free[:, 1]
+        singular = both & (kxx * kyy - kxy**2 <= tolerance * (kxx + kyy) ** 2)
+        singular |= free[:, 0] & ~both & (kxx <= tolerance * scale)
+        singular |= free[:, 1] & ~both & (kyy <= tolerance * scale)
+
+        if np.any(singular):
+            raise StabilityError(
+                "Free displacements have no stiffness", np.flatnonzero(singular)
+            )
+
+    @staticmethod
+    def pivots(rigidity: np.ndarray, supports: np.ndarray, tolerance: float = 1e-12):
+        free = np.flatnonzero(~supports.ravel())
+        k = csc_matrix(rigidity)[free][:, free]
+
+        if k.shape[0] == 0:
+            return
+
+        shift = tolerance * np.abs(k.diagonal()).max()
+        factor = splu(
+            (k + shift * identity(k.shape[0], format="csc")).tocsc(),
+            permc_spec="MMD_AT_PLUS_A",
+            diag_pivot_thresh=0.0,
+            options={"SymmetricMode": True},
+        )
+        mode = np.random.default_rng(0).standard_normal(k.shape[0])
+
+        for _ in range(3):
+            mode = factor.solve(mode)
+            mode /= np.linalg.norm(mode)
+
+        if mode @ (k @ mode) > shift:
+            return
+
+        raise StabilityError(
+            "Supports and beams form a mechanism",
+            free[np.abs(mode) > np.sqrt(tolerance) * np.abs(mode).max()] // 2,
+        )
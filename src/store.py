@@ -0,0 +1,480 @@
+from functools import partial
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from .assembly import Assembly
+from .material import Material
+
+
+class Views:
+    factory: Callable[[int], object]
+
+    def __init__(self, factory: Callable[[int], object] = None):
+        self.factory = factory
+        self._items = []
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._items)))]
+
+        item = self._items[index]
+
+        if item is None:
+            index = range(len(self._items))[index]
+            item = self._items[index] = self.factory(index)
+
+        return item
+
+    def __setitem__(self, index, item):
+        self._items[index] = item
+
+    def __iter__(self):
+        for i in range(len(self._items)):
+            yield self[i]
+
+    def __contains__(self, item):
+        return item is not None and item in self._items
+
+    def append(self, item):
+        self._items.append(item)
+
+    def extend(self, items):
+        self._items.extend(items)
+
+
+class Table:
+    size: int
+    capacity: int
+    views: Views
+
+    def __init__(self, capacity: int = 1, **columns: tuple):
+        self.size = 0
+        self.capacity = max(capacity, 1)
+        self.views = Views()
+        self._specs = columns
+        self._columns: Dict[str, np.ndarray] = dict.fromkeys(columns)
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self._get_column(name)[: self.size]
+
+    def allocated(self, name: str):
+        return self._columns[name] is not None
+
+    def value(self, name: str, index: int):
+        column = self._columns[name]
+
+        if column is None:
+            return Table._get_fill(self._specs[name])
+
+        return column[index]
+
+    def row(self, index: int):
+        return {
+            name: column[index]
+            for name, column in self._columns.items()
+            if column is not None
+        }
+
+    def append(self, view, **values):
+        index = self.size
+
+        self.reserve(index + 1)
+
+        for name, value in values.items():
+            self._get_column(name)[index] = value
+
+        self.views.append(view)
+        self.size += 1
+
+        return index
+
+    def extend(self, count: int, **values):
+        start = self.size
+
+        self.reserve(start + count)
+
+        for name, value in values.items():
+            self._get_column(name)[start : start + count] = value
+
+        self.views.extend([None] * count)
+        self.size += count
+
+        return np.arange(start, start + count)
+
+    def attach(self, count: int, **arrays: np.ndarray):
+        if count == 0:
+            return self.extend(0)
+
+        self._columns = {
+            name: (
+                np.asarray(arrays[name], dtype=self._specs[name][0])
+                if name in arrays
+                else None
+            )
+            for name in self._columns
+        }
+        self.views.extend([None] * count)
+        self.size = self.capacity = count
+
+        return np.arange(count)
+
+    def reserve(self, size: int):
+        capacity = self.capacity
+
+        if size <= capacity:
+            return
+
+        while capacity < size:
+            capacity *= 2
+
+        for name, column in self._columns.items():
+            if column is None:
+                continue
+
+            resized = Table._allocate(capacity, *self._specs[name])
+            resized[: self.size] = column[: self.size]
+
+            self._columns[name] = resized
+
+        self.capacity = capacity
+
+    def copy(self):
+        table = Table.__new__(Table)
+        table.size = self.size
+        table.capacity = max(self.size, 1)
+        table.views = Views()
+        table.views.extend([None] * self.size)
+        table._specs = self._specs
+        table._columns = {
+            name: None if column is None else column[: table.capacity].copy()
+            for name, column in self._columns.items()
+        }
+
+        return table
+
+    def _get_column(self, name: str):
+        column = self._columns[name]
+
+        if column is None:
+            column = self._columns[name] = Table._allocate(
+                self.capacity, *self._specs[name]
+            )
+
+        return column
+
+    @staticmethod
+    def _get_fill(spec: tuple):
+        dtype, shape, *fill = spec
+        value = fill[0] if fill else None
+
+        if np.dtype(dtype) == object:
+            return value
+
+        return np.full(shape, value or 0, dtype=dtype)[()]
+
+    @staticmethod
+    def _allocate(capacity: int, dtype: type, shape: tuple, fill=None):
+        if np.dtype(dtype) == object:
+            return np.full((capacity, *shape), fill, dtype=object)
+
+        return np.full((capacity, *shape), fill or 0, dtype=dtype)
+
+
+class Row:
+    size: int = 1
+
+    def __init__(self, columns: Dict[str, tuple], **values):
+        self._columns = columns
+        self._values = values
+
+    def __len__(self):
+        return 1
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        value = self._values.get(name)
+
+        if not isinstance(value, np.ndarray):
+            column = Table._allocate(1, *self._columns[name])
+
+            if value is not None:
+                column[0] = value
+
+            value = self._values[name] = column
+
+        return value
+
+    def allocated(self, name: str):
+        return isinstance(self._values.get(name), np.ndarray)
+
+    def value(self, name: str, index: int):
+        value = self._values.get(name)
+
+        if isinstance(value, np.ndarray):
+            return value[index]
+
+        return Table._get_fill(self._columns[name]) if value is None else value
+
+    def row(self, index: int):
+        return {
+            name: value[index] if isinstance(value, np.ndarray) else value
+            for name, value in self._values.items()
+        }
+
+
+class Store:
+    nodes: Table
+    beams: Table
+    loads: Table
+    materials: List[Material]
+    gravity: np.ndarray
+
+    NODES = {
+        "coordinates": (np.float64, (2,)),
+        "version": (np.int64, ()),
+        "supports": (np.bool_, (2,)),
+        "loads": (np.float64, (2,)),
+        "forces": (object, ()),
+    }
+    BEAMS = {
+        "connectivity": (np.intp, (2,)),
+        "material": (np.intp, (), -1),
+        "color": (object, (), "#BBB"),
+        "geometry": (np.float64, (5,)),
+        "cached": (np.int64, (4,), -1),
+    }
+    LOADS = {
+        "beam": (np.intp, ()),
+        "load": (np.float64, (2,)),
+    }
+
+    def __init__(self, capacity: int = 1):
+        self.nodes = Table(capacity, **Store.NODES)
+        self.beams = Table(capacity, **Store.BEAMS)
+        self.loads = Table(capacity, **Store.LOADS)
+        self._initialize()
+
+    def _initialize(self):
+        self.gravity = None
+        self.materials = []
+        self._material_ids: Dict[int, int] = {}
+        self._material_values: Dict[tuple, int] = {}
+        self._properties = None
+        self._versions = None
+
+    @classmethod
+    def detached(cls, nodes: dict = None, beams: dict = None):
+        store = cls.__new__(cls)
+        store.nodes = Row(Store.NODES, **(nodes or {}))
+        store.beams = Row(Store.BEAMS, **(beams or {}))
+        store.loads = None
+        store._initialize()
+
+        return store
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._material_ids = {
+            id(material): i for i, material in enumerate(self.materials)
+        }
+
+    def bind(self, node: type, beam: type):
+        self.nodes.views.factory = partial(node._view, self)
+        self.beams.views.factory = partial(beam._view, self)
+
+        return self
+
+    def add_node(self, node):
+        source, index = node._store, node._index
+
+        node._index = self.nodes.append(node, **source.nodes.row(index))
+        node._store = self
+
+        return node
+
+    def add_beam(self, beam):
+        source, index = beam._store, beam._index
+        values = source.beams.row(index)
+        material = source.get_material(values.get("material", -1))
+
+        beam._index = self.beams.append(
+            beam,
+            connectivity=(beam.node1.id, beam.node2.id),
+            material=self.register_material(material),
+            color=values.get("color", Store.BEAMS["color"][2]),
+        )
+        beam._store = self
+
+        return beam
+
+    def register_material(self, material: Material):
+        if material is None:
+            return -1
+
+        key = id(material)
+
+        if key not in self._material_ids:
+            self._material_ids[key] = len(self.materials)
+            self.materials.append(material)
+
+        return self._material_ids[key]
+
+    def intern_material(self, material: Material):
+        key = material.values
+        index = self._material_values.get(key)
+
+        if index is None or self.materials[index].values != key:
+            index = self._material_values[key] = self.register_material(material)
+
+        return self.materials[index]
+
+    def get_material(self, index: int):
+        return self.materials[index] if index >= 0 else None
+
+    @property
+    def properties(self) -> np.ndarray:
+        versions = np.array(
+            [material._version for material in self.materials] + [-1], dtype=np.int64
+        )
+
+        if not np.array_equal(versions, self._versions):
+            self._properties = np.array(
+                [
+                    [np.nan if value is None else value for value in material.values]
+                    for material in self.materials
+                ]
+                + [[np.nan] * len(Material.PROPERTIES)],
+                dtype=np.float64,
+            )
+            self._versions = versions
+
+        return self._properties
+
+    def get_material_arrays(self):
+        index = self.beams["material"]
+
+        if np.any(index < 0):
+            raise ValueError("Every beam must have a material before solving")
+
+        values = self.properties[index]
+
+        return values[:, 0], values[:, 1]
+
+    def get_material_array(self, name: str):
+        column = Material.PROPERTIES.index(name)
+
+        return self.properties[self.beams["material"], column]
+
+    def get_loads(self):
+        nodes, beams = self.nodes, self.beams
+        index = [self.loads["beam"]]
+        loads = [self.loads["load"]]
+
+        if self.gravity is not None:
+            weight = self.get_material_array("density") * self.get_material_array(
+                "area"
+            )
+
+            if np.any(np.isnan(weight)):
+                raise ValueError("Every beam must have a density to apply gravity")
+
+            index.append(np.arange(len(beams)))
+            loads.append(np.multiply.outer(weight, self.gravity))
+
+        index = np.concatenate(index)
+
+        if index.shape[0] == 0:
+            return nodes["loads"].copy()
+
+        connectivity = beams["connectivity"][index]
+        ends = Assembly.distributed(
+            nodes["coordinates"], connectivity, np.concatenate(loads)
+        )
+        targets = np.concatenate((np.arange(len(nodes)), connectivity.ravel()))
+        values = np.concatenate((nodes["loads"], np.repeat(ends, 2, axis=0)))
+
+        return np.column_stack(
+            [
+                np.bincount(targets, weights=values[:, i], minlength=len(nodes))
+                for i in range(2)
+            ]
+        )
+
+    def get_geometry_key(self, node1, node2, material: int):
+        version = self.materials[material]._version if material >= 0 else -1
+
+        return (node1._version, node2._version, material, version)
+
+    def update_geometry(self):
+        beams = self.beams
+        connectivity = beams["connectivity"]
+        material = beams["material"]
+        version = self.nodes["version"]
+        properties = self.properties
+        key = np.column_stack(
+            (
+                version[connectivity[:, 0]],
+                version[connectivity[:, 1]],
+                material,
+                self._versions[material],
+            )
+        )
+        stale = np.flatnonzero(np.any(key != beams["cached"], axis=1))
+
+        if stale.shape[0] == 0:
+            return self
+
+        beams["geometry"][stale] = Store.get_geometry(
+            self.nodes["coordinates"],
+            connectivity[stale],
+            properties[material[stale], 0],
+            properties[material[stale], 1],
+        )
+        beams["cached"][stale] = key[stale]
+
+        return self
+
+    @staticmethod
+    def get_geometry(
+        coordinates: np.ndarray,
+        connectivity: np.ndarray,
+        elasticity: np.ndarray,
+        area: np.ndarray,
+    ):
+        sin, cos, length = Assembly.geometry(coordinates, connectivity)
+        delta = coordinates[connectivity[:, 0]] - coordinates[connectivity[:, 1]]
+        angle = np.arctan2(delta[:, 1], delta[:, 0]) - np.pi
+        rigidity = elasticity * area / length
+
+        return np.column_stack((sin, cos, length, angle, rigidity))
+
+    def copy(self):
+        store = Store.__new__(Store)
+        store.nodes = self.nodes.copy()
+        store.beams = self.beams.copy()
+        store.loads = self.loads.copy()
+        store.gravity = self.gravity
+        store.materials = list(self.materials)
+        store._material_ids = dict(self._material_ids)
+        store._material_values = dict(self._material_values)
+        store._properties = self._properties
+        store._versions = self._versions
+
+        for source, table in ((self.nodes, store.nodes), (self.beams, store.beams)):
+            if source.views.factory is not None:
+                table.views.factory = partial(source.views.factory.func, store)
+
+        if store.nodes.allocated("forces"):
+            forces = store.nodes["forces"]
+
+            for i, node_forces in enumerate(forces):
+                if node_forces is not None:
+                    forces[i] = list(node_forces)
+
+        return store
@@ -0,0 +1,169 @@
+import inspect
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from .method import Method, SparseCholesky_method
+from .results import Results
+
+
+class Sweep:
+    factory: Callable
+    parameters: List[dict]
+    shared: dict
+    fields: Tuple[str]
+    method: Method
+    processes: int
+    chunk_size: int
+    progress: Callable[[int, int], None]
+
+    SOLVE_PARAMETERS = ("charge", "method", "tolerance", "sparse", "ordering")
+
+    def __init__(
+        self,
+        factory: Callable,
+        grid: dict = None,
+        parameters: Iterable[dict] = None,
+        shared: dict = None,
+        fields: Sequence[str] = ("displacement", "forces", "internal_forces"),
+        method: Method = SparseCholesky_method,
+        processes: int = None,
+        chunk_size: int = None,
+        progress: Callable[[int, int], None] = None,
+    ):
+        self.factory = factory
+        self.parameters = Sweep.expand(grid) if parameters is None else list(parameters)
+        self.shared = shared or {}
+        self.fields = tuple(fields)
+        self.method = method
+        self.processes = processes or os.cpu_count() or 1
+        self.chunk_size = chunk_size or max(
+            1, -(-len(self.parameters) // (4 * self.processes))
+        )
+        self.progress = progress
+
+    def __len__(self):
+        return len(self.parameters)
+
+    @staticmethod
+    def expand(grid: dict):
+        names = list(grid)
+
+        return [dict(zip(names, values)) for values in product(*grid.values())]
+
+    def execute(self, results: Results = None):
+        if results is not None:
+            return self.write(results)
+
+        results = {name: [None] * len(self) for name in self.fields}
+
+        for start, columns in self.iterate():
+            for name, values in columns.items():
+                results[name][start : start + len(values)] = values
+
+        columns = {
+            name: Sweep._stack([values[name] for values in self.parameters])
+            for name in (self.parameters[0] if self.parameters else ())
+        }
+        columns.update((name, Sweep._stack(values)) for name, values in results.items())
+
+        return columns
+
+    def write(self, results: Results):
+        names = [
+            name
+            for name in (self.parameters[0] if self.parameters else ())
+            if all(isinstance(values[name], (int, float)) for values in self.parameters)
+        ]
+
+        for start, columns in self.iterate():
+            parameters = self.parameters[start : start + self.chunk_size]
+
+            results.extend(
+                index=np.arange(start, start + len(parameters)),
+                **{name: [values[name] for values in parameters] for name in names},
+                **columns,
+            )
+
+        return results.flush()
+
+    def iterate(self):
+        chunks = [
+            (start, self.parameters[start : start + self.chunk_size])
+            for start in range(0, len(self), self.chunk_size)
+        ]
+        done = 0
+
+        if self.processes == 1:
+            _initialize(self.factory, self.shared, self.fields, self.method)
+            completed = ((start, _execute(chunk)) for start, chunk in chunks)
+        else:
+            executor = ProcessPoolExecutor(
+                self.processes,
+                initializer=_initialize,
+                initargs=(self.factory, self.shared, self.fields, self.method),
+            )
+            futures = {
+                executor.submit(_execute, chunk): start for start, chunk in chunks
+            }
+            completed = (
+                (futures[future], future.result()) for future in as_completed(futures)
+            )
+
+        try:
+            for start, columns in completed:
+                done += len(next(iter(columns.values())))
+
+                if self.progress is not None:
+                    self.progress(done, len(self))
+
+                yield start, columns
+        finally:
+            if self.processes != 1:
+                executor.shutdown(cancel_futures=True)
+
+    @staticmethod
+    def _stack(values: list):
+        if len({np.shape(value) for value in values}) == 1:
+            return np.array(values)
+
+        column = np.empty(len(values), dtype=object)
+
+        for i, value in enumerate(values):
+            column[i] = value
+
+        return column
+
+
+_state: Dict[str, object] = {}
+
+
+def _initialize(factory: Callable, shared: dict, fields: Tuple[str], method: Method):
+    _state.update(factory=factory, shared=shared, fields=fields, method=method)
+
+
+def _execute(parameters: List[dict]):
+    factory = _state["factory"]
+    accepted = inspect.signature(factory).parameters
+    columns = {name: [] for name in _state["fields"]}
+
+    for values in parameters:
+        options = {"method": _state["method"]}
+        arguments = dict(_state["shared"])
+
+        for name, value in values.items():
+            if name in Sweep.SOLVE_PARAMETERS and name not in accepted:
+                options[name] = value
+            else:
+                arguments[name] = value
+
+        truss = factory(**arguments)
+        truss.solve(**options)
+
+        for name in columns:
+            columns[name].append(getattr(truss.solution, name))
+
+    return columns
@@ -1,105 +1,205 @@
-from typing import List, Type
+from typing import Iterable, Sequence, Type
 
 import numpy as np
-from matplotlib import pyplot as plt
-from matplotlib.colors import Colormap, TwoSlopeNorm
 
+from .animation import Animation
 from .beam import Beam
 from .material import Material
-from .method import GaussSeidel_method, Method
+from .method import GaussSeidel_method, Method, SparseCholesky_method
 from .node import Node
+from .ordering import Ordering
 from .plot import Plot
+from .profiler import Profiler
 from .solve import Solve
+from .store import Store
 
 
 class Truss(Solve, Plot):
-    nodes: List[Node]
-    beams: List[Beam]
+    store: Store
+    nodes: Sequence[Node]
+    beams: Sequence[Beam]
     material: Material
 
     def __init__(self):
         Solve.__init__(self)
         Plot.__init__(self)
 
-        self.nodes = []
-        self.beams = []
+        self.store = Store().bind(Node, Beam)
+        self.nodes = self.store.nodes.views
+        self.beams = self.store.beams.views
         self.material = None
 
     def add_node(self, node: Node):
-        last_id = Truss._get_last_id(self.nodes)
+        if node._store is not self.store:
+            self.store.add_node(node)
 
-        if node not in self.nodes:
-            node.id = last_id + 1
+        return self
 
-            self.nodes.append(node)
+    def add_nodes(self, nodes: Iterable[Node]):
+        for node in nodes:
+            self.add_node(node)
 
         return self
 
     def add_beam(self, beam: Beam):
-        last_id = Truss._get_last_id(self.beams)
-
-        if beam not in self.beams:
-            beam.id = last_id + 1
-
+        if beam._store is not self.store:
             self.add_node(beam.node1).add_node(beam.node2)
-            self.beams.append(beam)
+            self.store.add_beam(beam)
 
         return self
 
-    def add_truss(self, truss: Type["Truss"]):
-        for beam in truss.beams:
+    def add_beams(self, beams: Iterable[Beam]):
+        for beam in beams:
             self.add_beam(beam)
 
         return self
 
-    def make_node(self, x: float, y: float):
-        node = Node(x, y)
+    def add_truss(self, truss: Type["Truss"]):
+        return self.add_beams(truss.beams)
 
-        self.add_node(node)
+    def make_node(self, x: float, y: float):
+        index = self.store.nodes.append(None, coordinates=(x, y))
 
-        return node
+        return self.nodes[index]
 
     def make_beam(self, node1: Node, node2: Node):
-        beam = Beam(node1, node2).set_material(self.material)
+        self.add_node(node1).add_node(node2)
 
-        self.add_beam(beam)
+        index = self.store.beams.append(
+            None,
+            connectivity=(node1.id, node2.id),
+            material=self.store.register_material(self.material),
+        )
+
+        return self.beams[index]
+
+    def make_material(
+        self,
+        youngs_modulus: float,
+        area: float,
+        yield_stress: float = None,
+        inertia: float = None,
+        density: float = None,
+    ):
+        material = Material(youngs_modulus, area, yield_stress, inertia, density)
 
-        return beam
+        return self.store.intern_material(material)
 
     def set_material(self, material: Material):
         self.material = material
+        self.store.beams["material"][:] = self.store.register_material(material)
+
+        return self
+
+    def apply_forces(self, nodes: Iterable[Node], forces: np.ndarray):
+        index = Truss._get_ids(nodes)
+        forces = np.broadcast_to(np.asarray(forces, dtype=np.float64), (len(index), 2))
+
+        np.add.at(self.store.nodes["loads"], index, forces)
+        self.store.nodes["forces"][index] = None
+
+        return self
+
+    def apply_distributed_load(self, beams: Iterable[Beam], x: float, y: float):
+        index = Truss._get_ids(beams)
+
+        self.store.loads.extend(index.shape[0], beam=index, load=(x, y))
+
+        return self
+
+    def set_gravity(self, gravity: Sequence[float] = (0.0, -9.81)):
+        self.store.gravity = None if gravity is None else np.array(gravity, dtype=float)
+
+        return self
 
-        for beam in self.beams:
-            beam.set_material(self.material)
+    def set_threads(self, threads: int):
+        self.threads = threads
 
         return self
 
+    def set_profiler(self, profiler: Profiler):
+        self.profiler = profiler
+
+        return self
+
+    @classmethod
+    def from_arrays(
+        cls,
+        coordinates: np.ndarray,
+        connectivity: np.ndarray,
+        material: Material = None,
+        supports: np.ndarray = None,
+        loads: np.ndarray = None,
+    ):
+        truss = cls()
+        coordinates = np.asarray(coordinates, dtype=np.float64).reshape(-1, 2)
+        connectivity = np.asarray(connectivity, dtype=np.intp).reshape(-1, 2)
+
+        truss.store.nodes.extend(
+            coordinates.shape[0],
+            coordinates=coordinates,
+            supports=False if supports is None else supports,
+            loads=0.0 if loads is None else loads,
+        )
+        truss.store.beams.extend(connectivity.shape[0], connectivity=connectivity)
+        truss.set_material(material)
+
+        return truss
+
     def solve(
         self,
         charge: float = 1.0,
         method: Method = GaussSeidel_method,
         tolerance: float = 1e-5,
+        sparse: bool = True,
+        ordering: Ordering = None,
+    ):
+        Solve.execute(self, charge, method, tolerance, sparse, ordering)
+
+    def resolve(
+        self,
+        charge: float = 1.0,
+        tolerance: float = 1e-5,
+        max_rank: int = 64,
     ):
-        Solve.execute(self, charge, method, tolerance)
+        Solve.execute_update(self, charge, tolerance, max_rank)
 
-    def plot(
+    def solve_cases(
         self,
-        show_nodes: bool = True,
-        show_labels: bool = True,
-        color: str = None,
-        values: np.ndarray = None,
-        cmap: Type[Colormap] = plt.cm.rainbow,
-        norm: Type[TwoSlopeNorm] = None,
-        scale_label: str = None,
+        charges: np.ndarray = None,
+        forces: np.ndarray = None,
+        method: Method = SparseCholesky_method,
+        tolerance: float = 1e-5,
+        sparse: bool = True,
+        ordering: Ordering = None,
     ):
-        Plot.execute(
-            self, show_nodes, show_labels, color, values, cmap, norm, scale_label
+        return Solve.execute_cases(
+            self, charges, forces, method, tolerance, sparse, ordering
         )
 
+    def check_stability(self, tolerance: float = 1e-12):
+        return Solve.execute_stability(self, tolerance)
+
+    def animate(
+        self,
+        charges: np.ndarray = None,
+        forces: np.ndarray = None,
+        method: Method = SparseCholesky_method,
+        tolerance: float = 1e-5,
+        values: str = "internal_forces",
+        **kwargs,
+    ):
+        cases = self.solve_cases(charges, forces, method, tolerance)
+
+        return Animation(self._coordinates, self._connectivity, cases, values, **kwargs)
+
     @staticmethod
-    def execute():
-        pass
+    def _get_ids(items: Iterable):
+        if isinstance(items, np.ndarray):
+            return items.astype(np.intp).reshape(-1)
+
+        return np.array([item.id for item in items], dtype=np.intp)
 
     @staticmethod
-    def _get_last_id(collection):
-        return collection[-1].id if len(collection) > 0 else -1
+    def execute():
+        pass